@@ -6,7 +6,6 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from converter import RestoredNamesConverter
 
 
 def main():
@@ -64,6 +63,8 @@ def main():
     
     args = parser.parse_args()
     
+    # Imported after argument parsing so --help stays fast
+    from converter import RestoredNamesConverter
     converter = RestoredNamesConverter(overrides_file=args.overrides_file)
     
     # Handle override management commands
@@ -103,8 +104,7 @@ def main():
     if args.input:
         input_path = Path(args.input)
         if input_path.exists():
-            with open(input_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            text = input_path.read_text(encoding='utf-8')
         else:
             # Treat as literal text
             text = args.input
@@ -133,8 +133,7 @@ def main():
     
     # Write output
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(converted)
+        Path(args.output).write_text(converted, encoding='utf-8')
     else:
         print(converted)
 
@@ -10,22 +10,70 @@ Converts KJV Bible text to use restored Hebrew names:
 Supports verse-aware mode and witnessed overrides.
 """
 
+import contextlib
 import json
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 
+# Pattern for book chapter:verse (handles numbered books like "1 John")
+# Matches: optional number, space, book name, space, chapter:verse
+# A match never starts inside a run of letters (the run's first letter would
+# match further left), so those start positions are skipped up front
+_VERSE_REF_RE = re.compile(r'((?:\d+\s*|\s+|(?<![A-Za-z]))[A-Za-z]+(?:\s+[A-Za-z]+)?)\s+(\d+):(\d+)')
+
+# Cheap test for the chapter:verse tail; verse text rarely has one
+_VERSE_REF_HINT_RE = re.compile(r'\s\d+:\d')
+
+
+def _fuse_mappings(mappings: List[Tuple[str, str]]) -> 're.Pattern':
+    """
+    Compile word-bounded mappings into a single case-insensitive alternation.
+    
+    Alternatives keep list order, so longer compound forms win over the
+    single names they start with. Applying the list one pattern at a time
+    lets "Jesus Christ" claim its Jesus before "Christ Jesus" is tried; the
+    lookahead on the "Christ Jesus" entry keeps that precedence. The shared
+    leading boundary and first-letter lookahead let the engine skip most
+    positions cheaply.
+    
+    IGNORECASE is kept on purpose: explicit [Ll][Oo]... classes measure no
+    faster, and matching a lowercased copy would need a Python-level splice
+    and breaks offsets where str.lower() changes length (e.g. U+0130).
+    
+    Args:
+        mappings: (pattern, replacement) pairs, each pattern starting with \\b
+    
+    Returns:
+        Compiled pattern with one capturing group per mapping
+    """
+    alternatives = ['(' + pattern[2:] + ')' for pattern, _ in mappings]
+    first_letters = ''.join(sorted({pattern[2].lower() for pattern, _ in mappings}))
+    return re.compile(
+        r'\b(?=[' + first_letters + '])(?:' + '|'.join(alternatives) + ')',
+        re.IGNORECASE
+    )
+
+
 class RestoredNamesConverter:
     """Converts KJV text to restored Hebrew names."""
     
+    __slots__ = (
+        'overrides_file',
+        'overrides',
+        '_batch_depth',
+        '_dirty',
+    )
+    
     # Default name mappings
     # Note: Patterns are applied with case-insensitive flag
     DEFAULT_MAPPINGS = [
         # Compound forms first (longer patterns)
         (r'\bLord\s+God\b', 'YAHUAH'),
         (r'\bJesus\s+Christ\b', "YAHUSHA HA'MASHIACH"),
-        (r'\bChrist\s+Jesus\b', "HA'MASHIACH YAHUSHA"),
+        # Not where the Jesus starts "Jesus Christ" (applied first)
+        (r'\bChrist\s+Jesus\b(?!\s+Christ\b)', "HA'MASHIACH YAHUSHA"),
         (r'\bHoly\s+Spirit\b', 'RUACH HAQODESH'),
         (r'\bHoly\s+Ghost\b', 'RUACH HAQODESH'),
         
@@ -37,12 +85,38 @@ class RestoredNamesConverter:
         (r'\bMessiah\b', "HA'MASHIACH"),
     ]
     
+    
     # Short form contexts (where YAH is used instead of YAHUAH)
     SHORT_FORM_PATTERNS = [
         r'\bHallelu\s*YAH\b',  # Hallelujah -> HalleluYAH
         r'\bYAH\s+weh\b',      # Yahweh contexts
     ]
     
+    # Hallelujah forms collapsed to HalleluYAH by apply_short_form
+    SHORT_FORM_MAPPINGS = [
+        (r'\bHallelu\s*jah\b', 'HalleluYAH'),
+        (r'\bHallelu\s*YAH\b', 'HalleluYAH'),
+    ]
+    _COMPILED_SHORT = [
+        (re.compile(pattern, re.IGNORECASE), replacement)
+        for pattern, replacement in SHORT_FORM_MAPPINGS
+    ]
+    
+    # DEFAULT_MAPPINGS followed by the short forms, fused into one alternation
+    # so convert_text scans the text once. Group N holds mapping N, so the
+    # replacement is _FUSED_REPL[N] (index 0 is unused).
+    _FUSED_MAPPINGS = _fuse_mappings(DEFAULT_MAPPINGS + SHORT_FORM_MAPPINGS)
+    _FUSED_REPL = [None] + [replacement for _, replacement in DEFAULT_MAPPINGS + SHORT_FORM_MAPPINGS]
+    
+    # Cheap prefilter: text whose lowercase form contains none of these words
+    # cannot match _FUSED_MAPPINGS. IGNORECASE also folds the listed
+    # characters onto i/s, which str.lower() does not, so they bypass it.
+    _PREFILTER_WORDS = ('lord', 'god', 'jesus', 'christ', 'messiah', 'holy', 'hallelu')
+    _PREFILTER_FOLDS = ('\u0130', '\u0131', '\u017f')
+    
+    # Joins verse texts for batch_convert's single pass
+    _BATCH_SEPARATOR = '\x00'
+    
     def __init__(self, overrides_file: Optional[str] = None):
         """
         Initialize converter.
@@ -52,6 +126,9 @@ class RestoredNamesConverter:
         """
         self.overrides_file = Path(overrides_file) if overrides_file else Path('overrides.json')
         self.overrides: Dict[str, Dict] = {}
+        # add_override defers saving while inside batch()
+        self._batch_depth = 0
+        self._dirty = False
         self.load_overrides()
     
     def load_overrides(self) -> None:
@@ -68,6 +145,7 @@ class RestoredNamesConverter:
     
     def save_overrides(self) -> None:
         """Save overrides to JSON file."""
+        self._dirty = False
         with open(self.overrides_file, 'w', encoding='utf-8') as f:
             json.dump(self.overrides, f, indent=2, ensure_ascii=False)
     
@@ -84,10 +162,10 @@ class RestoredNamesConverter:
         Returns:
             Tuple of (book, chapter, verse) or None
         """
-        # Pattern for book chapter:verse (handles numbered books like "1 John")
-        # Matches: optional number, space, book name, space, chapter:verse
-        pattern = r'(\d*\s*[A-Za-z]+(?:\s+[A-Za-z]+)?)\s+(\d+):(\d+)'
-        match = re.search(pattern, text)
+        if not _VERSE_REF_HINT_RE.search(text):
+            return None
+        
+        match = _VERSE_REF_RE.search(text)
         if match:
             book = match.group(1).strip()
             chapter = int(match.group(2))
@@ -128,13 +206,33 @@ class RestoredNamesConverter:
             'witnesses': witnesses or [],
             'require_witness': require_witness
         }
-        self.save_overrides()
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save_overrides()
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Defer saving overrides until the block exits.
+        
+        add_override normally rewrites the whole overrides file; inside
+        ``with converter.batch():`` the file is written once at the end.
+        Blocks may be nested; only the outermost one saves.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.save_overrides()
     
     def apply_short_form(self, text: str) -> str:
         """Apply short form YAH where appropriate."""
         # Check for Hallelujah patterns
-        text = re.sub(r'\bHallelu\s*jah\b', 'HalleluYAH', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bHallelu\s*YAH\b', 'HalleluYAH', text, flags=re.IGNORECASE)
+        for pattern, replacement in self._COMPILED_SHORT:
+            text = pattern.sub(replacement, text)
         
         # In certain contexts, YAHUAH might be shortened to YAH
         # This is context-dependent and can be overridden per verse
@@ -169,29 +267,43 @@ class RestoredNamesConverter:
         
         # Check for verse-specific override
         if verse_aware and verse_ref:
-            override = self.get_override(verse_ref)
+            override = self._applicable_override(verse_ref, enforce_witnesses)
             if override:
-                # Check if we should apply this override
-                should_apply = True
-                
-                # If enforce_witnesses is True, only apply overrides with witnesses
-                if enforce_witnesses:
-                    witnesses = override.get('witnesses', [])
-                    if not witnesses:
-                        # Skip override if no witnesses when enforcement is enabled
-                        should_apply = False
-                
-                if should_apply:
-                    return override['replacement']
-        
-        # Apply default mappings in order (already sorted by length, longer patterns first)
-        for pattern, replacement in self.DEFAULT_MAPPINGS:
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-        
-        # Apply short form conversions
-        result = self.apply_short_form(result)
-        
-        return result
+                return override['replacement']
+        
+        return self._apply_mappings(result)
+    
+    def _applicable_override(self, verse_ref: str, enforce_witnesses: bool) -> Optional[Dict]:
+        """Return the override for verse_ref if it should be applied, else None."""
+        if not self.overrides:
+            return None
+        override = self.get_override(verse_ref)
+        # If enforce_witnesses is True, only apply overrides with witnesses
+        if override and enforce_witnesses and not override.get('witnesses', []):
+            return None
+        return override
+    
+    def _apply_mappings(self, text: str) -> str:
+        """Apply default mappings and short forms, ignoring overrides."""
+        # Skip the regex entirely for text with no convertible names
+        if not self._may_contain_names(text):
+            return text
+        
+        # Apply default mappings and short forms in a single pass
+        # (longer patterns first in the alternation)
+        return self._FUSED_MAPPINGS.sub(_fused_replacement, text)
+    
+    def _may_contain_names(self, text: str) -> bool:
+        """Cheap prefilter: False only if _FUSED_MAPPINGS cannot match text."""
+        # Plain loops: generator expressions with any() cost twice as much here
+        lowered = text.lower()
+        for word in self._PREFILTER_WORDS:
+            if word in lowered:
+                return True
+        for char in self._PREFILTER_FOLDS:
+            if char in text:
+                return True
+        return False
     
     def convert_verse(
         self,
@@ -232,22 +344,42 @@ class RestoredNamesConverter:
         Returns:
             List of converted verses with 'original' and 'converted' keys
         """
-        results = []
-        for verse in verses:
-            original = verse.get('text', '')
-            converted = self.convert_verse(
-                original,
-                verse['book'],
-                verse['chapter'],
-                verse['verse'],
-                enforce_witnesses=enforce_witnesses
-            )
-            results.append({
+        originals = [verse.get('text', '') for verse in verses]
+        converted = [None] * len(verses)
+        
+        # Verses with an applicable override take its replacement; all others
+        # are joined and converted in one pass, then split back apart. The
+        # separator is neither whitespace nor a word character, so no pattern
+        # can match across it and word boundaries are unchanged.
+        pending = []
+        for i, verse in enumerate(verses):
+            verse_ref = self.get_verse_key(verse['book'], verse['chapter'], verse['verse'])
+            override = self._applicable_override(verse_ref, enforce_witnesses)
+            if override:
+                converted[i] = override['replacement']
+            elif self._BATCH_SEPARATOR in originals[i]:
+                converted[i] = self._apply_mappings(originals[i])
+            else:
+                pending.append(i)
+        
+        if pending:
+            joined = self._BATCH_SEPARATOR.join(originals[i] for i in pending)
+            pieces = self._apply_mappings(joined).split(self._BATCH_SEPARATOR)
+            for i, piece in zip(pending, pieces):
+                converted[i] = piece
+        
+        return [
+            {
                 'book': verse['book'],
                 'chapter': verse['chapter'],
                 'verse': verse['verse'],
                 'original': original,
-                'converted': converted
-            })
-        return results
+                'converted': text
+            }
+            for verse, original, text in zip(verses, originals, converted)
+        ]
+
 
+def _fused_replacement(match: 're.Match') -> str:
+    """Return the replacement for a _FUSED_MAPPINGS match."""
+    return RestoredNamesConverter._FUSED_REPL[match.lastindex]
@@ -6,13 +6,29 @@ A tool to convert King James Version (KJV) Bible text to use restored Hebrew nam
 
 __version__ = "1.0.0"
 
+import importlib
+
 from kjv_restored.converter import RestoredNamesConverter
 from kjv_restored.config import Config
 from kjv_restored.witness import WitnessManager
 from kjv_restored.checklist import ChecklistGenerator
 from kjv_restored.assembler import BibleAssembler
-from kjv_restored.export_docx import DOCXExporter
-from kjv_restored.export_pdf import PDFExporter
+
+# The exporters pull in python-docx/reportlab, so they are imported on first access
+_LAZY_EXPORTS = {
+    "DOCXExporter": "kjv_restored.export_docx",
+    "PDFExporter": "kjv_restored.export_pdf",
+}
+
+
+def __getattr__(name):
+    """Import exporter classes on first access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "RestoredNamesConverter",
@@ -1,13 +1,51 @@
 """Bible assembly and structure generation."""
 
+from collections import Counter
 from datetime import datetime
+from itertools import groupby
 from typing import Dict, List, Iterator, Tuple, Optional, Any
-import json
 from pathlib import Path
 
 from kjv_restored.converter import RestoredNamesConverter
 from kjv_restored.config import Config
 from kjv_restored.books import sort_verses, normalize_book_name
+from kjv_restored.jsonio import load_json
+
+
+def _convert_book(
+    converter: RestoredNamesConverter,
+    book: str,
+    book_verses: List[Dict[str, Any]]
+) -> Tuple[List[str], List[Dict], List[Dict], List[Dict]]:
+    """
+    Convert one book's verses in a worker process.
+    
+    Args:
+        converter: Converter copy received by the worker
+        book: Normalized book name
+        book_verses: The book's verse dicts, in order
+        
+    Returns:
+        Converted texts plus the applied override, heuristic replacement
+        and ambiguous Lord entries recorded while converting them
+    """
+    converter.reset_tracking()
+    texts = [
+        converter.convert_verse(
+            verse.get('text', ''),
+            book,
+            verse.get('chapter', 0),
+            verse.get('verse', 0),
+            strict=converter.config.strict_mode
+        )
+        for verse in book_verses
+    ]
+    return (
+        texts,
+        converter.get_applied_overrides(),
+        converter.get_heuristic_replacements(),
+        converter.get_ambiguous_lords()
+    )
 
 
 class BibleAssembler:
@@ -21,7 +59,12 @@ class BibleAssembler:
             converter: RestoredNamesConverter instance
         """
         self.converter = converter
-        self.stats = {
+        self.stats = self._empty_stats()
+    
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        """Statistics before any verse has been assembled."""
+        return {
             'total_verses': 0,
             'books_processed': 0,
             'chapters_processed': 0,
@@ -29,6 +72,11 @@ class BibleAssembler:
             'applied_overrides': 0
         }
     
+    def reset(self) -> None:
+        """Clear the statistics and the converter's tracking from earlier passes."""
+        self.stats = self._empty_stats()
+        self.converter.reset_tracking()
+    
     def load_verses(self, input_path: Path) -> List[Dict[str, Any]]:
         """
         Load and sort verses from JSON file.
@@ -39,8 +87,7 @@ class BibleAssembler:
         Returns:
             Sorted list of verse dicts
         """
-        with open(input_path, 'r', encoding='utf-8') as f:
-            verses = json.load(f)
+        verses = load_json(input_path)
         
         if not isinstance(verses, list):
             raise ValueError("Input JSON must be a list of verse objects")
@@ -49,7 +96,48 @@ class BibleAssembler:
         sorted_verses = sort_verses(verses)
         return sorted_verses
     
-    def assemble(self, verses: List[Dict[str, Any]], progress_callback: Optional[callable] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    def _convert_parallel(self, verses: List[Dict[str, Any]], max_workers: int) -> List[str]:
+        """
+        Convert all verse texts in worker processes, one task per book.
+        
+        Tracking entries from the workers are appended to the converter in
+        verse order, as a serial pass would record them.
+        
+        Args:
+            verses: List of verse dicts
+            max_workers: Number of worker processes
+            
+        Returns:
+            Converted texts, aligned with verses
+        """
+        groups = [
+            (book, list(book_verses))
+            for book, book_verses in groupby(
+                verses, key=lambda verse: normalize_book_name(verse.get('book', ''))
+            )
+        ]
+        # Imported here: multiprocessing adds ~15 ms to every CLI start
+        from concurrent.futures import ProcessPoolExecutor
+        
+        converted = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                _convert_book,
+                [self.converter] * len(groups),
+                [book for book, _ in groups],
+                [book_verses for _, book_verses in groups]
+            )
+            for texts, applied, heuristic, ambiguous in results:
+                converted.extend(texts)
+                self.converter.merge_tracking(applied, heuristic, ambiguous)
+        return converted
+    
+    def assemble(
+        self,
+        verses: List[Dict[str, Any]],
+        progress_callback: Optional[callable] = None,
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """
         Assemble Bible structure, yielding events.
         
@@ -58,31 +146,31 @@ class BibleAssembler:
         - ("toc", {})
         - ("book", {"name": "Genesis", "number": 1})
         - ("chapter", {"book": "Genesis", "number": 1})
-        - ("verse", {"book": "Genesis", "chapter": 1, "verse": 1, "text": "..."})
+        - ("verse", {"book": "Genesis", "chapter": 1, "verse": 1, "text": "...", "original_text": "..."})
         - ("end", {})
         
         Args:
             verses: List of verse dicts
             progress_callback: Optional callback(book, chapter, verse) for progress updates
+            max_workers: Convert books in this many worker processes before
+                yielding (default: convert each verse as it is yielded)
             
         Yields:
             Tuples of (event_type, event_data)
         """
         # Reset stats for this assembly pass
-        self.stats = {
-            'total_verses': 0,
-            'books_processed': 0,
-            'chapters_processed': 0,
-            'ambiguous_lords': 0,
-            'applied_overrides': 0
-        }
+        self.stats = self._empty_stats()
+        
+        converted = None
+        if max_workers is not None and max_workers > 1:
+            converted = self._convert_parallel(verses, max_workers)
         
         current_book = None
         current_chapter = None
         books_seen = set()
         chapters_seen = set()
         
-        for verse in verses:
+        for index, verse in enumerate(verses):
             book = normalize_book_name(verse.get('book', ''))
             chapter = verse.get('chapter', 0)
             verse_num = verse.get('verse', 0)
@@ -110,27 +198,20 @@ class BibleAssembler:
                 yield ("chapter", {"book": book, "number": chapter})
             
             # Convert verse text
-            verse_ref = f"{book} {chapter}:{verse_num}"
-            converted_text = self.converter.convert_verse(
-                text,
-                book,
-                chapter,
-                verse_num,
-                strict=self.converter.config.strict_mode
-            )
+            if converted is not None:
+                converted_text = converted[index]
+            else:
+                converted_text = self.converter.convert_verse(
+                    text,
+                    book,
+                    chapter,
+                    verse_num,
+                    strict=self.converter.config.strict_mode
+                )
             
             # Track stats
             self.stats['total_verses'] += 1
             
-            # Update override and ambiguous lord counts
-            applied = self.converter.get_applied_overrides()
-            if applied:
-                self.stats['applied_overrides'] = len(applied)
-            
-            ambiguous = self.converter.get_ambiguous_lords()
-            if ambiguous:
-                self.stats['ambiguous_lords'] = len(ambiguous)
-            
             # Yield verse event
             yield ("verse", {
                 "book": book,
@@ -144,8 +225,79 @@ class BibleAssembler:
             if progress_callback:
                 progress_callback(book, chapter, verse_num)
         
+        # Override and ambiguous lord counts come from the converter's tracking
+        # lists, so they are read once rather than after every verse
+        self.stats['applied_overrides'] = len(self.converter.get_applied_overrides())
+        self.stats['ambiguous_lords'] = len(self.converter.get_ambiguous_lords())
+        
         yield ("end", {})
     
+    def assemble_columns(
+        self,
+        verses: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Convert verses into parallel lists instead of an event stream.
+        
+        For consumers that need every verse but no book/chapter events, this
+        skips building an event tuple and dict per verse. Statistics are
+        updated as by a full assemble() pass.
+        
+        Args:
+            verses: List of verse dicts
+            max_workers: Convert books in this many worker processes
+                (default: convert in this process)
+            
+        Returns:
+            Dict of equal-length lists keyed 'book', 'chapter', 'verse',
+            'text' (converted) and 'original_text'
+        """
+        self.stats = self._empty_stats()
+        
+        converted = None
+        if max_workers is not None and max_workers > 1:
+            converted = self._convert_parallel(verses, max_workers)
+        
+        books = []
+        chapters = []
+        verse_nums = []
+        texts = []
+        original_texts = []
+        convert_verse = self.converter.convert_verse
+        strict = self.converter.config.strict_mode
+        
+        for index, verse in enumerate(verses):
+            book = normalize_book_name(verse.get('book', ''))
+            chapter = verse.get('chapter', 0)
+            verse_num = verse.get('verse', 0)
+            text = verse.get('text', '')
+            
+            if converted is not None:
+                converted_text = converted[index]
+            else:
+                converted_text = convert_verse(text, book, chapter, verse_num, strict=strict)
+            
+            books.append(book)
+            chapters.append(chapter)
+            verse_nums.append(verse_num)
+            texts.append(converted_text)
+            original_texts.append(text)
+        
+        self.stats['total_verses'] = len(texts)
+        self.stats['books_processed'] = len(set(books))
+        self.stats['chapters_processed'] = len({f"{book}:{chapter}" for book, chapter in zip(books, chapters)})
+        self.stats['applied_overrides'] = len(self.converter.get_applied_overrides())
+        self.stats['ambiguous_lords'] = len(self.converter.get_ambiguous_lords())
+        
+        return {
+            'book': books,
+            'chapter': chapters,
+            'verse': verse_nums,
+            'text': texts,
+            'original_text': original_texts,
+        }
+    
     def generate_report(self, title: str, version: str) -> Dict[str, Any]:
         """
         Generate conversion report.
@@ -157,26 +309,27 @@ class BibleAssembler:
         Returns:
             Report dictionary
         """
+        applied_overrides = self.converter.get_applied_overrides()
         report = {
             'title': title,
             'version': version,
             'generated_date': datetime.now().isoformat(),
             'statistics': self.stats.copy(),
-            'applied_overrides': self.converter.get_applied_overrides(),
+            'applied_overrides': applied_overrides,
             'ambiguous_lord_occurrences': self.converter.get_ambiguous_lords(),
             'heuristic_replacements': self.converter.get_heuristic_replacements()
         }
         
         # Add replacement counts
-        replacement_counts = {}
-        for override in self.converter.get_applied_overrides():
-            replacements = override.get('replacements', {})
-            for original, replacement in replacements.items():
-                if original != '__full_text__':
-                    key = f"{original} -> {replacement}"
-                    replacement_counts[key] = replacement_counts.get(key, 0) + 1
+        replacement_counts = Counter()
+        for override in applied_overrides:
+            replacement_counts.update(
+                f"{original} -> {replacement}"
+                for original, replacement in override.get('replacements', {}).items()
+                if original != '__full_text__'
+            )
         if replacement_counts:
-            report['replacement_counts'] = replacement_counts
+            report['replacement_counts'] = dict(replacement_counts)
         
         return report
 
@@ -1,5 +1,10 @@
 """Canonical Bible book ordering and utilities."""
 
+import functools
+import re
+import sys
+from typing import Optional
+
 # Canonical order of Bible books (KJV standard)
 CANONICAL_BOOKS = [
     # Old Testament
@@ -45,7 +50,37 @@ BOOK_NAME_MAPPINGS = {
     "Ps": "Psalms",
 }
 
+# Lowercased canonical names -> canonical name (variants in
+# BOOK_NAME_MAPPINGS only match as written)
+_BOOK_LOOKUP = {book.lower(): book for book in CANONICAL_BOOKS}
+
+# Canonical name -> order index
+_BOOK_ORDER = {book: index for index, book in enumerate(CANONICAL_BOOKS)}
+
+
+def _book_name_pattern(name: str) -> str:
+    """Regex for a book name whose spaces match any whitespace run."""
+    return r'\s+'.join(map(re.escape, name.split()))
 
+
+# Any known book name (in any case) or variant (as written) at the end of the
+# searched span, matching what normalize_book_name resolves. Since every
+# alternative ends at the same place, the leftmost match is the longest name
+# ("Song of Solomon", "1st John"). A name right after a number or ordinal is
+# not matched, so "1ST JOHN" or "4 John" is left to the generic pattern
+# rather than read as John.
+_BOOK_SUFFIX_RE = re.compile(
+    r'(?<![A-Za-z0-9])(?<!\d\s)(?<!\d[A-Za-z]{2}\s)(?:'
+    + '|'.join(
+        [f'(?i:{_book_name_pattern(book)})' for book in CANONICAL_BOOKS]
+        + [_book_name_pattern(variant) for variant in BOOK_NAME_MAPPINGS]
+    )
+    + r')$'
+)
+_LONGEST_BOOK_NAME = max(map(len, [*CANONICAL_BOOKS, *BOOK_NAME_MAPPINGS]))
+
+
+@functools.lru_cache(maxsize=256)
 def normalize_book_name(book: str) -> str:
     """
     Normalize book name to canonical form.
@@ -54,23 +89,36 @@ def normalize_book_name(book: str) -> str:
         book: Book name (may have variations)
         
     Returns:
-        Canonical book name
+        Canonical book name (known names return the shared table string;
+        unknown names are interned so spellings differing only in
+        surrounding whitespace share one object)
     """
     book = book.strip()
-    # Check mappings first
-    if book in BOOK_NAME_MAPPINGS:
-        return BOOK_NAME_MAPPINGS[book]
-    # Check if it's already canonical
-    if book in CANONICAL_BOOKS:
-        return book
-    # Try case-insensitive match
-    for canonical in CANONICAL_BOOKS:
-        if canonical.lower() == book.lower():
-            return canonical
-    # Return as-is if no match found
-    return book
+    # Variants match as written; canonical names in any case
+    canonical = BOOK_NAME_MAPPINGS.get(book)
+    if canonical is None:
+        canonical = _BOOK_LOOKUP.get(book.lower())
+    return canonical if canonical is not None else sys.intern(book)
+
+
+def match_book_name(text: str, end: int) -> Optional[str]:
+    """
+    Find a known book name ending exactly at text[end].
+    
+    Args:
+        text: Text containing a verse reference
+        end: Index just past the book name candidate
+        
+    Returns:
+        The book name as written in text, or None if no known name ends there
+    """
+    # Allow extra room for names written with runs of whitespace
+    start = max(0, end - 2 * _LONGEST_BOOK_NAME)
+    match = _BOOK_SUFFIX_RE.search(text, start, end)
+    return match.group(0) if match else None
 
 
+@functools.lru_cache(maxsize=256)
 def get_book_order(book: str) -> int:
     """
     Get canonical order index for a book.
@@ -81,11 +129,8 @@ def get_book_order(book: str) -> int:
     Returns:
         Order index (0-based), or 999 if not found
     """
-    normalized = normalize_book_name(book)
-    try:
-        return CANONICAL_BOOKS.index(normalized)
-    except ValueError:
-        return 999  # Unknown books go to end
+    # Unknown books go to end
+    return _BOOK_ORDER.get(normalize_book_name(book), 999)
 
 
 def sort_verses(verses: list) -> list:
@@ -117,10 +162,6 @@ def is_old_testament(book: str) -> bool:
     Returns:
         True if OT, False if NT or unknown
     """
-    normalized = normalize_book_name(book)
-    try:
-        index = CANONICAL_BOOKS.index(normalized)
-        return index < 39  # First 39 books are OT
-    except ValueError:
-        return False
+    # First 39 books are OT
+    return _BOOK_ORDER.get(normalize_book_name(book), 999) < 39
 
@@ -4,9 +4,70 @@ import re
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 
+from kjv_restored.books import get_book_order
 from kjv_restored.io import FormatHandler
+from kjv_restored.jsonio import dump_json
+
+
+# Sensitive tokens checked by scan_verse, found in a single finditer pass.
+# "Praise ye the LORD" (any case) only consumes "Praise" so the LORD it ends
+# with is still seen by the lord_upper group.
+_SCAN_RE = re.compile(
+    r'(?=[LJPp])(?:'
+    r'\b(?:(?P<lord>Lord)|(?P<lord_upper>LORD)|(?P<jah>JAH))\b'
+    r'|(?P<praise>(?i:Praise)(?=(?i: ye the LORD)))'
+    r')'
+)
+
+
+def _checklist_items(seen: Set[str], verse_ref: str) -> List[Dict[str, Any]]:
+    """
+    Build the checklist items for one verse.
+    
+    Args:
+        seen: _SCAN_RE group names found in the verse
+        verse_ref: Verse reference (e.g., "Romans 10:13")
+        
+    Returns:
+        List of checklist items for this verse
+    """
+    items = []
+    
+    # Check for "Lord" (not all caps) - NT ambiguous
+    if 'lord' in seen and 'lord_upper' not in seen:
+        items.append({
+            'ref': verse_ref,
+            'needs': 'Lord decision',
+            'suggested': 'YAHUAH (if OT quote) or ADON (if NT reference)',
+            'witnesses_required': ['cepher', 'dabar_yahuah']
+        })
+    
+    # Check for "Praise ye the LORD" - hallelujah heuristic candidate
+    if 'praise' in seen:
+        items.append({
+            'ref': verse_ref,
+            'needs': 'Hallelujah heuristic decision',
+            'suggested': 'Hallelu-YAH (if appropriate)',
+            'witnesses_required': []
+        })
+    
+    # Check for "JAH" token - may need override
+    if 'jah' in seen:
+        items.append({
+            'ref': verse_ref,
+            'needs': 'JAH token review',
+            'suggested': 'YAH (KJV contains JAH)',
+            'witnesses_required': ['kjv_token']
+        })
+    
+    # Check for other sensitive patterns
+    # "God" vs "GOD" distinction
+    # Only flag if it's ambiguous (not already handled by default rules)
+    # This is less critical, so we'll skip it for now
+    
+    return items
 
 
 class ChecklistGenerator:
@@ -29,41 +90,37 @@ class ChecklistGenerator:
         Returns:
             List of checklist items for this verse
         """
-        items = []
-        verse_ref = f"{book} {chapter}:{verse}"
-        
-        # Check for "Lord" (not all caps) - NT ambiguous
-        if re.search(r'\bLord\b', text) and not re.search(r'\bLORD\b', text):
-            items.append({
-                'ref': verse_ref,
-                'needs': 'Lord decision',
-                'suggested': 'YAHUAH (if OT quote) or ADON (if NT reference)',
-                'witnesses_required': ['cepher', 'dabar_yahuah']
-            })
+        # Every token _SCAN_RE looks for contains "JAH" or some casing of
+        # "lord", and most verses have neither
+        if 'JAH' not in text and 'lord' not in text.lower():
+            return []
         
-        # Check for "Praise ye the LORD" - hallelujah heuristic candidate
-        if re.search(r'Praise ye the LORD', text, re.IGNORECASE):
-            items.append({
-                'ref': verse_ref,
-                'needs': 'Hallelujah heuristic decision',
-                'suggested': 'Hallelu-YAH (if appropriate)',
-                'witnesses_required': []
-            })
-        
-        # Check for "JAH" token - may need override
-        if re.search(r'\bJAH\b', text):
-            items.append({
-                'ref': verse_ref,
-                'needs': 'JAH token review',
-                'suggested': 'YAH (KJV contains JAH)',
-                'witnesses_required': ['kjv_token']
-            })
-        
-        # Check for other sensitive patterns
-        # "God" vs "GOD" distinction
-        # Only flag if it's ambiguous (not already handled by default rules)
-        # This is less critical, so we'll skip it for now
+        seen = {match.lastgroup for match in _SCAN_RE.finditer(text)}
+        return _checklist_items(seen, f"{book} {chapter}:{verse}")
+    
+    def scan_verses(self, texts: List[str], refs: List[Tuple[str, int, int]]) -> List[Dict[str, Any]]:
+        """
+        Scan many verses, with the same items as calling scan_verse on each.
         
+        Args:
+            texts: Verse texts
+            refs: (book, chapter, verse) for each text
+            
+        Returns:
+            Checklist items for all verses, in input order
+            
+        Raises:
+            ValueError: If texts and refs differ in length
+        """
+        items = []
+        finditer = _SCAN_RE.finditer
+        for text, (book, chapter, verse) in zip(texts, refs, strict=True):
+            # Same prefilter as scan_verse
+            if 'JAH' not in text and 'lord' not in text.lower():
+                continue
+            seen = {match.lastgroup for match in finditer(text)}
+            if seen:
+                items.extend(_checklist_items(seen, f"{book} {chapter}:{verse}"))
         return items
     
     def generate_checklist(
@@ -74,18 +131,27 @@ class ChecklistGenerator:
         """
         Generate checklist from JSON input file.
         
+        A ``.jsonl`` input is read as JSON Lines and scanned one verse at a
+        time instead of being loaded as a whole list first.
+        
         Args:
-            input_path: Path to input JSON file (list of verse objects)
+            input_path: Path to input JSON file (list of verse objects), or
+                JSON Lines file (one verse object per line)
             output_path: Path to output checklist JSON file
             
         Returns:
             List of checklist items
         """
-        # Read verses from JSON
-        verses = self.format_handler.read_json(input_path)
+        # Read verses from JSON, streaming JSON Lines input
+        if input_path and Path(input_path).suffix == '.jsonl':
+            verses = self.format_handler.iter_jsonl(input_path)
+        else:
+            verses = self.format_handler.read_json(input_path)
         
-        # Scan all verses
-        checklist = []
+        # Scan all verses, keeping the first item per (verse ref, need)
+        # alongside its (book order, book, chapter, verse) sort key; the book
+        # name keeps books outside the canon (all order 999) apart
+        checklist = {}
         for verse in verses:
             text = verse.get('text', '')
             book = verse.get('book', '')
@@ -93,24 +159,17 @@ class ChecklistGenerator:
             verse_num = verse.get('verse', 0)
             
             items = self.scan_verse(text, book, chapter, verse_num)
-            checklist.extend(items)
-        
-        # Remove duplicates (same verse ref with same need)
-        seen = set()
-        unique_checklist = []
-        for item in checklist:
-            key = (item['ref'], item['needs'])
-            if key not in seen:
-                seen.add(key)
-                unique_checklist.append(item)
+            if items:
+                sort_key = (get_book_order(book), book, chapter, verse_num)
+                for item in items:
+                    checklist.setdefault((item['ref'], item['needs']), (sort_key, item))
         
-        # Sort by reference
-        unique_checklist.sort(key=lambda x: x['ref'])
+        # Sort by canonical reference (Genesis 2:1 before Genesis 10:1)
+        unique_checklist = [item for _, item in sorted(checklist.values(), key=lambda entry: entry[0])]
         
         # Write to output file
         if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(unique_checklist, f, indent=2, ensure_ascii=False)
+            dump_json(unique_checklist, output_path)
         else:
             # Write to stdout
             json.dump(unique_checklist, sys.stdout, indent=2, ensure_ascii=False)
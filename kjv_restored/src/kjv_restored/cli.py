@@ -11,10 +11,7 @@ from kjv_restored.converter import RestoredNamesConverter
 from kjv_restored.io import ConversionIO
 from kjv_restored.checklist import ChecklistGenerator
 from kjv_restored.assembler import BibleAssembler
-from kjv_restored.export_docx import DOCXExporter
-from kjv_restored.export_pdf import PDFExporter
-from kjv_restored.books import normalize_book_name
-from kjv_restored.witness_checker import WitnessChecker
+from kjv_restored.jsonio import dump_json, load_json
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -86,7 +83,7 @@ Examples:
         '--make-checklist',
         type=str,
         metavar='OUTPUT_FILE',
-        help='Generate override checklist from JSON input (requires --in)'
+        help='Generate override checklist from JSON or JSON Lines (.jsonl) input (requires --in)'
     )
     
     # Build Bible arguments
@@ -122,6 +119,13 @@ Examples:
         action='store_true',
         help='Fail if YAH-short overrides lack required witnesses (for build-bible)'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes for build-bible: converts books in parallel and '
+             'renders the PDF alongside the DOCX (default: 1)'
+    )
     
     # Automated witness checking
     parser.add_argument(
@@ -157,8 +161,13 @@ Examples:
 
 def save_report(report_path: Path, report: dict) -> None:
     """Save conversion report to JSON file."""
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    dump_json(report, report_path)
+
+
+def _export_pdf(title: str, version: str, events: list, pdf_path: Path) -> None:
+    """Render the PDF from assembled events (runs in a worker with --jobs)."""
+    from kjv_restored.export_pdf import PDFExporter
+    PDFExporter(title, version).export(events, pdf_path)
 
 
 def handle_build_bible(args) -> int:
@@ -216,34 +225,33 @@ def handle_build_bible(args) -> int:
         if verse_count % 1000 == 0:
             print(f"Processed {verse_count} verses...", file=sys.stderr)
     
-    # Collect books for TOC
-    books_list = []
-    for verse in verses:
-        book = verse.get('book', '')
-        normalized = normalize_book_name(book)
-        if normalized not in books_list:
-            books_list.append(normalized)
-    
-    # Process verses once to collect stats (even if exports fail)
+    # Convert all verses once (stats are collected even if exports fail);
+    # both exporters replay the same events
     print("Processing verses...", file=sys.stderr)
-    converter._applied_overrides = []
-    converter._heuristic_replacements = []
-    converter._ambiguous_lords = []
-    events_for_stats = assembler.assemble(verses, progress_callback=progress_callback)
-    # Consume events to collect stats
-    list(events_for_stats)
+    jobs = max(1, args.jobs)
+    converter.reset_tracking()
+    events = list(assembler.assemble(
+        verses,
+        progress_callback=progress_callback,
+        max_workers=jobs if jobs > 1 else None
+    ))
+    
+    # With --jobs the PDF (the slower export) renders in a worker process
+    # while the DOCX is generated here
+    pdf_path = outdir / "restored_names_kjv.pdf"
+    pdf_executor = None
+    pdf_future = None
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pdf_executor = ProcessPoolExecutor(max_workers=1)
+        pdf_future = pdf_executor.submit(_export_pdf, args.title, args.version, events, pdf_path)
     
     # Export to DOCX
     print("Generating DOCX...", file=sys.stderr)
     try:
-        # Reset converter tracking for fresh pass
-        converter._applied_overrides = []
-        converter._heuristic_replacements = []
-        converter._ambiguous_lords = []
-        
+        from kjv_restored.export_docx import DOCXExporter
         docx_exporter = DOCXExporter(args.title, args.version)
         docx_path = outdir / "restored_names_kjv.docx"
-        events = assembler.assemble(verses, progress_callback=progress_callback)
         docx_exporter.export(events, docx_path, progress_callback)
         print(f"Generated: {docx_path}", file=sys.stderr)
     except ImportError as e:
@@ -257,15 +265,12 @@ def handle_build_bible(args) -> int:
     # Export to PDF
     print("Generating PDF...", file=sys.stderr)
     try:
-        # Reset converter tracking for fresh pass
-        converter._applied_overrides = []
-        converter._heuristic_replacements = []
-        converter._ambiguous_lords = []
-        
-        pdf_exporter = PDFExporter(args.title, args.version)
-        pdf_path = outdir / "restored_names_kjv.pdf"
-        events = assembler.assemble(verses, progress_callback=progress_callback)
-        pdf_exporter.export(events, pdf_path, progress_callback)
+        if pdf_future is not None:
+            pdf_future.result()
+        else:
+            from kjv_restored.export_pdf import PDFExporter
+            pdf_exporter = PDFExporter(args.title, args.version)
+            pdf_exporter.export(events, pdf_path, progress_callback)
         print(f"Generated: {pdf_path}", file=sys.stderr)
     except ImportError as e:
         print(f"Warning: PDF export unavailable: {e}", file=sys.stderr)
@@ -274,8 +279,11 @@ def handle_build_bible(args) -> int:
         print(f"Error generating PDF: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc()
+    finally:
+        if pdf_executor is not None:
+            pdf_executor.shutdown()
     
-    # Generate report (stats should already be collected from export passes)
+    # Generate report (stats were collected by the assembly pass)
     report = assembler.generate_report(args.title, args.version)
     report_path = outdir / "restored_names_kjv.report.json"
     save_report(report_path, report)
@@ -315,8 +323,7 @@ def handle_auto_check(args) -> int:
         return 1
     
     # Load KJV verses
-    with open(input_path, 'r', encoding='utf-8') as f:
-        verses = json.load(f)
+    verses = load_json(input_path)
     
     if not isinstance(verses, list):
         print("Error: Input JSON must be a list of verse objects", file=sys.stderr)
@@ -327,6 +334,7 @@ def handle_auto_check(args) -> int:
     dabar_path = Path(args.dabar_yahuah_file) if args.dabar_yahuah_file else None
     
     print(f"Loading witness files...", file=sys.stderr)
+    from kjv_restored.witness_checker import WitnessChecker
     checker = WitnessChecker(cepher_file=cepher_path, dabar_yahuah_file=dabar_path)
     
     if not checker.cepher_verses and not checker.dabar_yahuah_verses:
@@ -356,15 +364,13 @@ def handle_auto_check(args) -> int:
         
         # Merge with existing overrides if file exists
         if output_path.exists():
-            with open(output_path, 'r', encoding='utf-8') as f:
-                existing = json.load(f)
+            existing = load_json(output_path)
             # Merge (new overrides take precedence)
             existing.update(overrides)
             overrides = existing
         
         # Save overrides
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(overrides, f, indent=2, ensure_ascii=False)
+        dump_json(overrides, output_path)
         
         print(f"Generated {len(overrides)} override entries: {output_path}", file=sys.stderr)
     
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 
 @dataclass
@@ -15,6 +15,7 @@ class Config:
     verse_aware: bool = True
     short_name_mode: str = "kjv_only"  # "kjv_only" | "witnessed" | "off"
     hallelujah_heuristic: bool = False
+    overrides: Optional[Dict[str, Dict]] = None  # Used instead of reading overrides_file
     
     @classmethod
     def from_args(
@@ -1,16 +1,104 @@
 """Core converter for KJV to restored Hebrew names."""
 
+import functools
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from kjv_restored.rules import NameRules
 from kjv_restored.witness import WitnessManager
 from kjv_restored.config import Config
+from kjv_restored.books import match_book_name
+
+
+# Pattern for book chapter:verse (handles numbered books like "1 John")
+# A match never starts inside a run of letters (the run's first letter would
+# match further left), so those start positions are skipped up front
+_VERSE_REF_RE = re.compile(r'((?:\d+\s*|\s+|(?<![A-Za-z]))[A-Za-z]+(?:\s+[A-Za-z]+)?)\s+(\d+):(\d+)')
+
+# Cheap test for the chapter:verse tail; verse text rarely has one
+_VERSE_REF_HINT_RE = re.compile(r'\s\d+:\d')
+
+# Tokens that drive convert_text, found in a single finditer pass: "Lord"
+# without any "LORD" in the verse is reported as ambiguous, JAH (any case)
+# is converted to YAH, and "Praise ye the LORD" triggers the Hallelujah
+# heuristic. Only "Praise" is consumed so its LORD is still seen.
+_TOKEN_RE = re.compile(
+    r'(?=[LJjP])(?:'
+    r'\b(?:(?P<lord>Lord)|(?P<lord_upper>LORD)|(?P<jah>(?i:JAH)))\b'
+    r'|(?P<praise>Praise(?= ye the LORD\b))'
+    r')'
+)
+
+_WORD_CHAR_RE = re.compile(r'\w')
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """Check whether a contains b or a suffix of a is a prefix of b."""
+    if b in a:
+        return True
+    return any(b.startswith(a[-i:]) for i in range(1, min(len(a), len(b))))
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_boundary_re(original: str) -> re.Pattern:
+    """Compile a whole-word pattern for an override key (escaped, so matched literally)."""
+    return re.compile(r'\b' + re.escape(original) + r'\b')
+
+
+@functools.lru_cache(maxsize=1024)
+def _fused_replacements_pattern(items: Tuple[Tuple[str, str], ...]) -> Optional[re.Pattern]:
+    """
+    Compile override replacements into one whole-word alternation.
+    
+    A single pass only gives the same text as applying the replacements one
+    after another when no replacement can affect another: keys must not
+    overlap each other or any other key's replacement, replacements must keep
+    the word/non-word character class at both ends of their key (so word
+    boundaries around neighbouring matches are unchanged), and replacements
+    must be plain text rather than re.sub templates.
+    
+    Args:
+        items: Tuple of (original, replacement) pairs
+    
+    Returns:
+        Compiled pattern, or None if the replacements must be applied in order
+    """
+    for original, replacement in items:
+        if not original or not replacement or '\\' in replacement:
+            return None
+        for edge in (0, -1):
+            if bool(_WORD_CHAR_RE.match(original[edge])) != bool(_WORD_CHAR_RE.match(replacement[edge])):
+                return None
+        for other, other_replacement in items:
+            if other == original:
+                continue
+            if _overlaps(original, other) or _overlaps(other_replacement, original) or _overlaps(original, other_replacement):
+                return None
+    
+    return re.compile(r'\b(?:' + '|'.join(re.escape(original) for original, _ in items) + r')\b')
+
+
+@functools.lru_cache(maxsize=65536, typed=True)
+def _verse_key(book: str, chapter: int, verse: int) -> str:
+    """
+    Build the "Book chapter:verse" key once per verse (the KJV has ~31k).
+    
+    typed=True keeps chapter 1 and 1.0 apart, since they format differently.
+    """
+    return f"{book} {chapter}:{verse}"
 
 
 class RestoredNamesConverter:
     """Converts KJV text to restored Hebrew names."""
     
+    __slots__ = (
+        'config',
+        'witness_manager',
+        '_applied_overrides',
+        '_heuristic_replacements',
+        '_ambiguous_lords',
+    )
+    
     def __init__(self, config: Optional[Config] = None, witness_manager: Optional[WitnessManager] = None):
         """
         Initialize converter.
@@ -20,7 +108,10 @@ class RestoredNamesConverter:
             witness_manager: Witness manager instance
         """
         self.config = config or Config()
-        self.witness_manager = witness_manager or WitnessManager(self.config.overrides_file)
+        self.witness_manager = witness_manager or WitnessManager(
+            self.config.overrides_file,
+            overrides=self.config.overrides
+        )
         self._applied_overrides = []  # Track applied overrides for reporting
         self._heuristic_replacements = []  # Track heuristic replacements
         self._ambiguous_lords = []  # Track ambiguous Lord occurrences
@@ -34,15 +125,20 @@ class RestoredNamesConverter:
         - "1 John 3:16"
         - "John 3:16"
         - "John 3:16-17" (returns first verse)
+        - "Song of Solomon 1:1"
         
         Returns:
             Tuple of (book, chapter, verse) or None
         """
-        # Pattern for book chapter:verse (handles numbered books like "1 John")
-        pattern = r'(\d*\s*[A-Za-z]+(?:\s+[A-Za-z]+)?)\s+(\d+):(\d+)'
-        match = re.search(pattern, text)
+        if not _VERSE_REF_HINT_RE.search(text):
+            return None
+        
+        match = _VERSE_REF_RE.search(text)
         if match:
-            book = match.group(1).strip()
+            # The generic pattern only allows two words and may take a word
+            # from the preceding text, so prefer a known book name ending
+            # where it does ("Song of Solomon 1:1", "see Genesis 1:1")
+            book = match_book_name(text, match.end(1)) or match.group(1).strip()
             chapter = int(match.group(2))
             verse = int(match.group(3))
             return (book, chapter, verse)
@@ -50,7 +146,7 @@ class RestoredNamesConverter:
     
     def get_verse_key(self, book: str, chapter: int, verse: int) -> str:
         """Generate verse key for overrides lookup."""
-        return f"{book} {chapter}:{verse}"
+        return _verse_key(book, chapter, verse)
     
     def convert_text(
         self,
@@ -96,9 +192,33 @@ class RestoredNamesConverter:
                 })
                 return result
         
+        return self._convert_default(result, verse_ref, strict_mode)
+    
+    def _convert_default(self, text: str, verse_ref: Optional[str], strict_mode: bool) -> str:
+        """
+        Convert text with the default rules and heuristics (no override).
+        
+        Args:
+            text: Input KJV text
+            verse_ref: Verse reference used in tracking records, if known
+            strict_mode: Leave ambiguous "Lord" unchanged
+        
+        Returns:
+            Converted text with restored names
+        """
+        result = text
+        
+        # Find the tokens once; every one contains some casing of "lord" or
+        # "jah", and most verses have neither
+        lowered = result.lower()
+        if 'lord' in lowered or 'jah' in lowered:
+            seen = {match.lastgroup for match in _TOKEN_RE.finditer(result)}
+        else:
+            seen = set()
+        
         # Track ambiguous "Lord" occurrences before conversion
         ambiguous_lords = []
-        if re.search(r'\bLord\b', result) and not re.search(r'\bLORD\b', result):
+        if 'lord' in seen and 'lord_upper' not in seen:
             # Found "Lord" (not all caps) - this is ambiguous
             ambiguous_lords.append({
                 'verse_ref': verse_ref or 'unknown',
@@ -107,12 +227,12 @@ class RestoredNamesConverter:
         
         # Apply JAH -> YAH conversion if short_name_mode is not "off"
         jah_changed = False
-        if self.config.short_name_mode != "off":
+        if self.config.short_name_mode != "off" and 'jah' in seen:
             result, jah_changed = NameRules.convert_jah_to_yah(result)
         
         # Apply Hallelujah heuristic if enabled (before default mappings to catch "LORD")
         hallelujah_changed = False
-        if self.config.hallelujah_heuristic:
+        if self.config.hallelujah_heuristic and 'praise' in seen:
             result, hallelujah_changed = NameRules.apply_hallelujah_heuristic(result)
         
         # Store heuristic info for reporting
@@ -175,20 +295,24 @@ class RestoredNamesConverter:
         if '__full_text__' in replacements:
             return replacements['__full_text__']
         
+        # Independent replacements are applied in one pass. Pattern.sub
+        # already assembles the output once in C; splicing finditer spans
+        # with "".join measured ~70% slower.
+        pattern = _fused_replacements_pattern(tuple(replacements.items()))
+        if pattern is not None:
+            return pattern.sub(lambda match: replacements[match.group(0)], result)
+        
         # Apply each replacement (use word boundaries for whole-word matching)
         for original, replacement in replacements.items():
-            # Escape special regex characters in original
-            escaped_original = re.escape(original)
-            # Use word boundaries for whole-word matching
-            pattern = r'\b' + escaped_original + r'\b'
-            result = re.sub(pattern, replacement, result)
+            result = _word_boundary_re(original).sub(replacement, result)
         
         return result
     
     def batch_convert(
         self,
         verses: List[Dict[str, any]],
-        strict: Optional[bool] = None
+        strict: Optional[bool] = None,
+        max_workers: Optional[int] = None
     ) -> List[Dict[str, any]]:
         """
         Convert multiple verses.
@@ -196,43 +320,169 @@ class RestoredNamesConverter:
         Args:
             verses: List of dicts with keys: 'text', 'book', 'chapter', 'verse'
             strict: Override config strict_mode (if provided)
+            max_workers: Convert contiguous chunks of verses in this many
+                worker processes (None or 1 converts in this process)
         
         Returns:
             List of converted verses with 'original' and 'converted' keys
         """
+        if max_workers is not None and max_workers > 1 and len(verses) > 1:
+            return self._batch_convert_parallel(verses, strict, max_workers)
+        
+        return list(self.iter_convert(verses, strict=strict))
+    
+    def iter_convert(
+        self,
+        verses: Iterable[Dict[str, any]],
+        strict: Optional[bool] = None
+    ) -> Iterator[Dict[str, any]]:
+        """
+        Convert verses one at a time as they are read.
+        
+        Tracking is reset when iteration starts and is complete once the
+        iterator is exhausted.
+        
+        Args:
+            verses: Iterable of dicts with keys: 'text', 'book', 'chapter', 'verse'
+            strict: Override config strict_mode (if provided)
+        
+        Yields:
+            Converted verses with 'original' and 'converted' keys
+        """
         # Reset tracking
-        self._applied_overrides = []
-        self._heuristic_replacements = []
-        self._ambiguous_lords = []
+        self.reset_tracking()
+        
+        # Without verse-aware mode no override can apply, so skip straight
+        # to the default rules instead of re-checking config per verse
+        verse_aware = self.config.verse_aware
+        strict_mode = strict if strict is not None else self.config.strict_mode
         
-        results = []
         for verse in verses:
             original = verse.get('text', '')
-            converted = self.convert_verse(
-                original,
-                verse['book'],
-                verse['chapter'],
-                verse['verse'],
-                strict=strict
-            )
-            results.append({
+            if verse_aware:
+                converted = self.convert_verse(
+                    original,
+                    verse['book'],
+                    verse['chapter'],
+                    verse['verse'],
+                    strict=strict
+                )
+            else:
+                verse_ref = self.get_verse_key(verse['book'], verse['chapter'], verse['verse'])
+                converted = self._convert_default(original, verse_ref, strict_mode)
+            yield {
                 'book': verse['book'],
                 'chapter': verse['chapter'],
                 'verse': verse['verse'],
                 'original': original,
                 'converted': converted
-            })
+            }
+    
+    def _batch_convert_parallel(
+        self,
+        verses: List[Dict[str, any]],
+        strict: Optional[bool],
+        max_workers: int
+    ) -> List[Dict[str, any]]:
+        """
+        Convert verses in worker processes, one contiguous chunk per worker.
+        
+        Tracking entries from the workers are merged in verse order, as a
+        serial batch_convert would record them.
+        
+        Args:
+            verses: List of verse dicts
+            strict: Override config strict_mode (if provided)
+            max_workers: Number of worker processes
+        
+        Returns:
+            List of converted verses with 'original' and 'converted' keys
+        """
+        # Imported here: multiprocessing adds ~15 ms to every CLI start
+        from concurrent.futures import ProcessPoolExecutor
+        
+        self.reset_tracking()
+        
+        chunk_size = -(-len(verses) // max_workers)
+        chunks = [verses[i:i + chunk_size] for i in range(0, len(verses), chunk_size)]
+        
+        results = []
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            for chunk_results, applied, heuristic, ambiguous in executor.map(
+                _batch_convert_chunk,
+                [self] * len(chunks),
+                chunks,
+                [strict] * len(chunks)
+            ):
+                results.extend(chunk_results)
+                self.merge_tracking(applied, heuristic, ambiguous)
         return results
     
+    def reset_tracking(self) -> None:
+        """
+        Start new override, heuristic and ambiguous Lord tracking lists.
+        
+        The lists are replaced rather than cleared, so lists returned by the
+        getters earlier (e.g. in a previous report) are left as they were.
+        """
+        self._applied_overrides = []
+        self._heuristic_replacements = []
+        self._ambiguous_lords = []
+    
+    def merge_tracking(
+        self,
+        applied_overrides: List[Dict],
+        heuristic_replacements: List[Dict],
+        ambiguous_lords: List[Dict]
+    ) -> None:
+        """
+        Append tracking entries recorded by another converter.
+        
+        Used to collect what worker processes recorded, in verse order.
+        
+        Args:
+            applied_overrides: Entries from get_applied_overrides()
+            heuristic_replacements: Entries from get_heuristic_replacements()
+            ambiguous_lords: Entries from get_ambiguous_lords()
+        """
+        self._applied_overrides.extend(applied_overrides)
+        self._heuristic_replacements.extend(heuristic_replacements)
+        self._ambiguous_lords.extend(ambiguous_lords)
+    
     def get_applied_overrides(self) -> List[Dict]:
         """Get list of applied overrides for reporting."""
-        return getattr(self, '_applied_overrides', [])
+        return self._applied_overrides
     
     def get_heuristic_replacements(self) -> List[Dict]:
         """Get list of heuristic replacements for reporting."""
-        return getattr(self, '_heuristic_replacements', [])
+        return self._heuristic_replacements
     
     def get_ambiguous_lords(self) -> List[Dict]:
         """Get list of ambiguous Lord occurrences for reporting."""
-        return getattr(self, '_ambiguous_lords', [])
+        return self._ambiguous_lords
+
 
+def _batch_convert_chunk(
+    converter: RestoredNamesConverter,
+    verses: List[Dict[str, any]],
+    strict: Optional[bool]
+) -> Tuple[List[Dict[str, any]], List[Dict], List[Dict], List[Dict]]:
+    """
+    Convert one chunk of verses in a worker process.
+    
+    Args:
+        converter: Converter copy received by the worker
+        verses: The chunk's verse dicts, in order
+        strict: Override config strict_mode (if provided)
+    
+    Returns:
+        Converted verses plus the applied override, heuristic replacement
+        and ambiguous Lord entries recorded while converting them
+    """
+    results = converter.batch_convert(verses, strict=strict)
+    return (
+        results,
+        converter.get_applied_overrides(),
+        converter.get_heuristic_replacements(),
+        converter.get_ambiguous_lords()
+    )
@@ -1,21 +1,91 @@
 """DOCX export for full Bible."""
 
 from datetime import datetime
+import functools
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, Any, Optional, Iterator, Tuple, List
-import sys
+import re
+import zipfile
 
 try:
     from docx import Document
     from docx.shared import Pt, Inches
     from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
     DOCX_AVAILABLE = True
 except ImportError:
     DOCX_AVAILABLE = False
 
 
+# Body paragraphs are written straight into word/document.xml as markup
+# identical to what python-docx generates for the same calls, so the
+# document never holds more than one batch of verses.
+
+# Placeholder paragraph marking where streamed body content goes
+_BODY_SENTINEL = 'KJV_RESTORED_BODY_SENTINEL'
+
+# Paragraphs buffered between writes to the document.xml stream
+_FLUSH_EVERY = 1024
+
+# document.xml is most of the package; deflate level 1 compresses it about
+# twice as fast as the default for a slightly larger file
+_BODY_COMPRESSLEVEL = 1
+
+# Characters lxml rejects in text; python-docx raised ValueError on them
+_XML_ILLEGAL_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+# Tabs and line breaks become <w:tab/> and <w:br/> elements in a run
+_RUN_BREAK_RE = re.compile(r'([\t\r\n])')
+
+_VERSE_NUMBER_RPR = '<w:rPr><w:sz w:val="18"/><w:vertAlign w:val="superscript"/></w:rPr>'
+
+# Title-page notice (same text in the DOCX and PDF exports)
+_DISCLAIMER = (
+    "Generated from user-supplied KJV text using restored-name rules. "
+    "This document does not include or redistribute text from Cepher Bible or Dâbâr Yahuah."
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_date() -> str:
+    """Title-page date, formatted once per process."""
+    return datetime.now().strftime('%B %d, %Y')
+
+
+def _text_xml(text: str) -> str:
+    """Build a <w:t> element for text without tabs or line breaks."""
+    escaped = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escaped}</w:t>'
+    return f'<w:t>{escaped}</w:t>'
+
+
+def _run_content_xml(text: str) -> str:
+    """
+    Build the inner content of a <w:r> run for text, as python-docx does.
+    
+    Args:
+        text: Run text
+    
+    Returns:
+        Run content markup
+    """
+    if _XML_ILLEGAL_RE.search(text):
+        raise ValueError("All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters")
+    if not _RUN_BREAK_RE.search(text):
+        return _text_xml(text) if text else ''
+    
+    parts = []
+    for piece in _RUN_BREAK_RE.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\r', '\n'):
+            parts.append('<w:br/>')
+        elif piece:
+            parts.append(_text_xml(piece))
+    return ''.join(parts)
+
+
 class DOCXExporter:
     """Exports Bible to DOCX format."""
     
@@ -35,6 +105,11 @@ class DOCXExporter:
         self.doc = Document()
         self._setup_document()
         self.current_page = 1
+        # Body paragraph markup waiting to be written by export()
+        self._body_xml = []
+        self._heading_style_ids = {
+            level: self.doc.styles[f'Heading {level}'].style_id for level in (1, 2)
+        }
     
     def _setup_document(self):
         """Set up document styles and initial structure."""
@@ -44,9 +119,10 @@ class DOCXExporter:
         font.name = 'Times New Roman'
         font.size = Pt(11)
         
-        # Set margins
-        sections = self.doc.sections
-        for section in sections:
+        # Set margins (the body is streamed in later, so these sections are
+        # all the document will have)
+        self._sections = list(self.doc.sections)
+        for section in self._sections:
             section.top_margin = Inches(1)
             section.bottom_margin = Inches(1)
             section.left_margin = Inches(1)
@@ -73,7 +149,7 @@ class DOCXExporter:
         
         # Date
         date_para = self.doc.add_paragraph()
-        date_run = date_para.add_run(f"Generated: {datetime.now().strftime('%B %d, %Y')}")
+        date_run = date_para.add_run(f"Generated: {_build_date()}")
         date_run.font.size = Pt(12)
         date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
@@ -82,10 +158,7 @@ class DOCXExporter:
         
         # Disclaimer
         disclaimer_para = self.doc.add_paragraph()
-        disclaimer_run = disclaimer_para.add_run(
-            "Generated from user-supplied KJV text using restored-name rules. "
-            "This document does not include or redistribute text from Cepher Bible or Dâbâr Yahuah."
-        )
+        disclaimer_run = disclaimer_para.add_run(_DISCLAIMER)
         disclaimer_run.font.size = Pt(10)
         disclaimer_run.italic = True
         disclaimer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -107,6 +180,12 @@ class DOCXExporter:
         
         self.doc.add_page_break()
     
+    def _add_heading_xml(self, text: str, level: int):
+        """Queue a heading paragraph (same markup as doc.add_heading)."""
+        style_id = self._heading_style_ids[level]
+        run = f'<w:r>{_run_content_xml(text)}</w:r>' if text else ''
+        self._body_xml.append(f'<w:p><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>{run}</w:p>')
+    
     def add_book_heading(self, book_name: str):
         """
         Add book heading.
@@ -148,11 +227,35 @@ class DOCXExporter:
         # Add space and text
         para.add_run(f" {text}")
     
+    def _add_book_heading_xml(self, book_name: str):
+        """Queue a book heading for export() (same markup as add_book_heading)."""
+        if self.current_page > 1:
+            self._body_xml.append('<w:p/>')
+        
+        self._add_heading_xml(book_name, 1)
+    
+    def _add_chapter_heading_xml(self, chapter_num: int):
+        """Queue a chapter heading for export() (same markup as add_chapter_heading)."""
+        self._add_heading_xml(f"Chapter {chapter_num}", 2)
+    
+    def _add_verse_xml(self, verse_num: int, text: str):
+        """Queue a verse paragraph for export() (same markup as add_verse)."""
+        # Verse number as 9pt superscript, then space and text; an int
+        # needs no escaping or whitespace handling
+        if type(verse_num) is int:
+            number_xml = f'<w:t>{verse_num}</w:t>'
+        else:
+            number_xml = _run_content_xml(f"{verse_num}")
+        self._body_xml.append(
+            f'<w:p><w:r>{_VERSE_NUMBER_RPR}{number_xml}</w:r>'
+            f'<w:r>{_run_content_xml(f" {text}")}</w:r></w:p>'
+        )
+    
     def add_footer(self):
         """Add footer with title and page number."""
         # Note: python-docx has limitations with page numbers
         # We'll add footer text, but true page numbers require more complex setup
-        for section in self.doc.sections:
+        for section in self._sections:
             footer = section.footer
             footer_para = footer.paragraphs[0]
             footer_para.text = f"{self.title} - Page "
@@ -167,44 +270,82 @@ class DOCXExporter:
             output_path: Output file path
             progress_callback: Optional progress callback
         """
-        books_seen = []
+        # Title page and footer go into a small python-docx document; the
+        # body is streamed into its document.xml in place of a sentinel
+        self.add_title_page()
+        self.doc.add_paragraph(_BODY_SENTINEL)
+        self.add_footer()
+        template = BytesIO()
+        self.doc.save(template)
+        
+        sentinel_xml = f'<w:p><w:r><w:t>{_BODY_SENTINEL}</w:t></w:r></w:p>'.encode('utf-8')
+        
+        try:
+            with zipfile.ZipFile(template) as source, \
+                    zipfile.ZipFile(str(output_path), 'w', zipfile.ZIP_DEFLATED,
+                                    compresslevel=_BODY_COMPRESSLEVEL) as target:
+                for item in source.infolist():
+                    if item.filename != 'word/document.xml':
+                        # Copied entries keep their own (default) level
+                        target.writestr(item, source.read(item.filename))
+                        continue
+                    
+                    head, tail = source.read(item.filename).split(sentinel_xml)
+                    # Opened by name, the entry takes the archive's level
+                    with target.open(item.filename, 'w', force_zip64=True) as stream:
+                        stream.write(head)
+                        self._write_body(events, stream, progress_callback)
+                        stream.write(tail)
+        except BaseException:
+            # Don't leave a truncated package behind
+            Path(output_path).unlink(missing_ok=True)
+            raise
+    
+    def _write_body(self, events: Iterator[Tuple[str, Dict[str, Any]]], stream, progress_callback: Optional[callable]):
+        """
+        Write body paragraphs for the event stream, a batch at a time.
+        
+        Args:
+            events: Iterator of (event_type, event_data) tuples
+            stream: Writable document.xml stream in the output package
+            progress_callback: Optional progress callback
+        """
         current_book = None
         current_chapter = None
         
-        # Add title page
-        self.add_title_page()
-        
         # Process events
         for event_type, event_data in events:
             if event_type == "book":
                 book_name = event_data["name"]
-                if book_name not in books_seen:
-                    books_seen.append(book_name)
                 current_book = book_name
-                self.add_book_heading(book_name)
+                self._add_book_heading_xml(book_name)
                 if progress_callback:
                     progress_callback(book_name, None, None)
             
             elif event_type == "chapter":
                 chapter_num = event_data["number"]
                 current_chapter = chapter_num
-                self.add_chapter_heading(chapter_num)
+                self._add_chapter_heading_xml(chapter_num)
             
             elif event_type == "verse":
                 verse_num = event_data["verse"]
                 text = event_data["text"]
-                self.add_verse(verse_num, text)
+                self._add_verse_xml(verse_num, text)
                 if progress_callback:
                     progress_callback(current_book, current_chapter, verse_num)
             
             elif event_type == "end":
                 break
+            
+            if len(self._body_xml) >= _FLUSH_EVERY:
+                self._flush_body(stream)
         
-        # Add footer
-        self.add_footer()
-        
-        # Save document
-        self.doc.save(str(output_path))
+        self._flush_body(stream)
+    
+    def _flush_body(self, stream):
+        """Write queued body paragraphs to the document.xml stream."""
+        stream.write(''.join(self._body_xml).encode('utf-8'))
+        self._body_xml.clear()
     
     @staticmethod
     def is_available() -> bool:
@@ -1,85 +1,166 @@
 """PDF export for full Bible."""
 
 from datetime import datetime
+import functools
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Any, Optional, Iterator, Tuple, List
-import sys
 
 try:
     from reportlab.lib.pagesizes import letter
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-    from reportlab.platypus.tableofcontents import TableOfContents
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT
-    from reportlab.pdfgen import canvas
+    from reportlab.lib.enums import TA_CENTER
     PDF_AVAILABLE = True
 except ImportError:
     PDF_AVAILABLE = False
 
 
-class PDFExporter:
-    """Exports Bible to PDF format."""
+# Paragraph text is parsed as markup, so literal text is escaped first
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Title-page notice (same text in the DOCX and PDF exports)
+_DISCLAIMER = (
+    "Generated from user-supplied KJV text using restored-name rules. "
+    "This document does not include or redistribute text from Cepher Bible or Dâbâr Yahuah."
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_date() -> str:
+    """Title-page date, formatted once per process."""
+    return datetime.now().strftime('%B %d, %Y')
+
+
+@functools.lru_cache(maxsize=1024)
+def _verse_number_markup(verse_num) -> str:
+    """Superscript verse-number markup, built once per number."""
+    number = f"{verse_num}".translate(_XML_ESCAPE)
+    return f"<font size='9'><sup>{number}</sup></font>"
+
+
+@functools.lru_cache(maxsize=None)
+def _paragraph_styles() -> Dict[str, Any]:
+    """
+    Build the sample stylesheet and custom paragraph styles once.
     
-    def __init__(self, title: str, version: str):
-        """
-        Initialize PDF exporter.
-        
-        Args:
-            title: Document title
-            version: Version string
-        """
-        if not PDF_AVAILABLE:
-            raise ImportError("reportlab is required. Install with: pip install reportlab")
-        
-        self.title = title
-        self.version = version
-        self.styles = getSampleStyleSheet()
-        self._setup_styles()
-        self.story = []
-        self.books_seen = []
+    Styles are only read while laying out paragraphs, so every exporter
+    can share them.
     
-    def _setup_styles(self):
-        """Set up custom paragraph styles."""
+    Returns:
+        Dict with the stylesheet ('sheet') and the book, chapter, verse
+        and title paragraph styles
+    """
+    sheet = getSampleStyleSheet()
+    return {
+        'sheet': sheet,
         # Book heading style
-        self.book_style = ParagraphStyle(
+        'book': ParagraphStyle(
             'BookHeading',
-            parent=self.styles['Heading1'],
+            parent=sheet['Heading1'],
             fontSize=18,
             textColor='black',
             spaceAfter=12,
             spaceBefore=12
-        )
-        
+        ),
         # Chapter heading style
-        self.chapter_style = ParagraphStyle(
+        'chapter': ParagraphStyle(
             'ChapterHeading',
-            parent=self.styles['Heading2'],
+            parent=sheet['Heading2'],
             fontSize=14,
             textColor='black',
             spaceAfter=6,
             spaceBefore=6
-        )
-        
+        ),
         # Verse style
-        self.verse_style = ParagraphStyle(
+        'verse': ParagraphStyle(
             'Verse',
-            parent=self.styles['Normal'],
+            parent=sheet['Normal'],
             fontSize=11,
             leading=14,
             spaceAfter=3,
             leftIndent=0
-        )
-        
+        ),
         # Title style
-        self.title_style = ParagraphStyle(
+        'title': ParagraphStyle(
             'Title',
-            parent=self.styles['Title'],
+            parent=sheet['Title'],
             fontSize=24,
             textColor='black',
             alignment=TA_CENTER,
             spaceAfter=12
-        )
+        ),
+    }
+
+
+if PDF_AVAILABLE:
+    class _StreamingDocTemplate(SimpleDocTemplate):
+        """
+        SimpleDocTemplate whose story list is refilled from an iterator.
+        
+        build() lays out flowables from the front of its list and calls the
+        filterFlowables hook before each one. Topping the story up there
+        whenever fewer than LOOKAHEAD flowables remain keeps only a small
+        window of the Bible's paragraphs alive (and the front deletions
+        cheap) while keepWithNext still sees the flowables after a heading.
+        """
+        
+        LOOKAHEAD = 64
+        BATCH = 256
+        
+        def __init__(self, filename: str, source: Iterator, **kw):
+            super().__init__(filename, **kw)
+            self._source = source
+            # The list to pass to build()
+            self.story = []
+            self.fill()
+        
+        def fill(self) -> None:
+            """Top up the story from the source if fewer than LOOKAHEAD flowables remain."""
+            if self._source is not None and len(self.story) < self.LOOKAHEAD:
+                count = len(self.story)
+                self.story.extend(islice(self._source, self.BATCH))
+                if len(self.story) - count < self.BATCH:
+                    self._source = None
+        
+        def filterFlowables(self, flowables):
+            # Also called for build()'s internal page-begin list; only the
+            # story is refilled
+            if flowables is self.story:
+                self.fill()
+            super().filterFlowables(flowables)
+
+
+class PDFExporter:
+    """Exports Bible to PDF format."""
+    
+    def __init__(self, title: str, version: str):
+        """
+        Initialize PDF exporter.
+        
+        Args:
+            title: Document title
+            version: Version string
+        """
+        if not PDF_AVAILABLE:
+            raise ImportError("reportlab is required. Install with: pip install reportlab")
+        
+        self.title = title
+        self.version = version
+        self.styles = _paragraph_styles()['sheet']
+        self._setup_styles()
+        self.story = []
+        self.books_seen = []
+        self._books_seen_set = set()
+    
+    def _setup_styles(self):
+        """Set up custom paragraph styles (shared by all exporters)."""
+        styles = _paragraph_styles()
+        self.book_style = styles['book']
+        self.chapter_style = styles['chapter']
+        self.verse_style = styles['verse']
+        self.title_style = styles['title']
     
     def _add_page_number(self, canvas_obj, doc):
         """Add page number to footer."""
@@ -106,18 +187,14 @@ class PDFExporter:
         self.story.append(Spacer(1, 0.3 * inch))
         
         # Date
-        date_text = f"Generated: {datetime.now().strftime('%B %d, %Y')}"
+        date_text = f"Generated: {_build_date()}"
         date_para = Paragraph(date_text, self.styles['Normal'])
         date_para.alignment = TA_CENTER
         self.story.append(date_para)
         self.story.append(Spacer(1, 0.5 * inch))
         
         # Disclaimer
-        disclaimer_text = (
-            "Generated from user-supplied KJV text using restored-name rules. "
-            "This document does not include or redistribute text from Cepher Bible or Dâbâr Yahuah."
-        )
-        disclaimer_para = Paragraph(disclaimer_text, self.styles['Normal'])
+        disclaimer_para = Paragraph(_DISCLAIMER, self.styles['Normal'])
         disclaimer_para.alignment = TA_CENTER
         self.story.append(disclaimer_para)
         
@@ -147,10 +224,11 @@ class PDFExporter:
         Args:
             book_name: Name of the book
         """
-        if book_name not in self.books_seen:
+        if book_name not in self._books_seen_set:
+            self._books_seen_set.add(book_name)
             self.books_seen.append(book_name)
         
-        heading = Paragraph(book_name, self.book_style)
+        heading = Paragraph(book_name.translate(_XML_ESCAPE), self.book_style)
         self.story.append(heading)
     
     def add_chapter_heading(self, chapter_num: int):
@@ -172,7 +250,7 @@ class PDFExporter:
             text: Verse text
         """
         # Format: "1 In the beginning..." with verse number in smaller font
-        verse_text = f"<font size='9'><sup>{verse_num}</sup></font> {text}"
+        verse_text = f"{_verse_number_markup(verse_num)} {text.translate(_XML_ESCAPE)}"
         para = Paragraph(verse_text, self.verse_style)
         self.story.append(para)
     
@@ -185,18 +263,54 @@ class PDFExporter:
             output_path: Output file path
             progress_callback: Optional progress callback
         """
+        # Add TOC (simplified - just list of books)
+        # Note: In a full implementation, we'd need to track page numbers
+        # For now, we'll add a simple TOC after title page
+        
+        # Build PDF; events are turned into flowables as the layout
+        # consumes them
+        doc = _StreamingDocTemplate(
+            str(output_path),
+            self._iter_story(events, progress_callback),
+            pagesize=letter,
+            rightMargin=1 * inch,
+            leftMargin=1 * inch,
+            topMargin=1 * inch,
+            bottomMargin=1 * inch
+        )
+        
+        # Add page number callback
+        def on_first_page(canvas_obj, doc):
+            self._add_page_number(canvas_obj, doc)
+        
+        def on_later_pages(canvas_obj, doc):
+            self._add_page_number(canvas_obj, doc)
+        
+        doc.build(doc.story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
+    
+    def _iter_story(self, events: Iterator[Tuple[str, Dict[str, Any]]], progress_callback: Optional[callable]) -> Iterator:
+        """
+        Yield the document's flowables, processing events on demand.
+        
+        Args:
+            events: Iterator of (event_type, event_data) tuples
+            progress_callback: Optional progress callback
+            
+        Yields:
+            Flowables in document order
+        """
         current_book = None
         current_chapter = None
         
         # Add title page
         self.add_title_page()
+        yield from self.story
+        self.story.clear()
         
         # Process events
         for event_type, event_data in events:
             if event_type == "book":
                 book_name = event_data["name"]
-                if book_name not in self.books_seen:
-                    self.books_seen.append(book_name)
                 current_book = book_name
                 self.add_book_heading(book_name)
                 if progress_callback:
@@ -216,29 +330,9 @@ class PDFExporter:
             
             elif event_type == "end":
                 break
-        
-        # Add TOC (simplified - just list of books)
-        # Note: In a full implementation, we'd need to track page numbers
-        # For now, we'll add a simple TOC after title page
-        
-        # Build PDF
-        doc = SimpleDocTemplate(
-            str(output_path),
-            pagesize=letter,
-            rightMargin=1 * inch,
-            leftMargin=1 * inch,
-            topMargin=1 * inch,
-            bottomMargin=1 * inch
-        )
-        
-        # Add page number callback
-        def on_first_page(canvas_obj, doc):
-            self._add_page_number(canvas_obj, doc)
-        
-        def on_later_pages(canvas_obj, doc):
-            self._add_page_number(canvas_obj, doc)
-        
-        doc.build(self.story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
+            
+            yield from self.story
+            self.story.clear()
     
     @staticmethod
     def is_available() -> bool:
@@ -1,13 +1,42 @@
 """Input/output handling for different formats."""
 
-import json
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from kjv_restored.converter import RestoredNamesConverter
+from kjv_restored.jsonio import dumps, iter_array, load_json, loads
 from kjv_restored.rules import NameRules
 
+# Output files get a 1 MiB buffer so large results go out in few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Marks an empty item stream in write_json
+_MISSING = object()
+
+
+def _same_file(input_path: Optional[Path], output_path: Optional[Path]) -> bool:
+    """
+    Check whether output would overwrite the input being streamed.
+    
+    Streaming conversions must read such input in full before the output
+    is opened (and truncated).
+    
+    Args:
+        input_path: Input file path (None for stdin)
+        output_path: Output file path (None for stdout)
+    
+    Returns:
+        True if both paths name the same existing file
+    """
+    if not input_path or not output_path:
+        return False
+    try:
+        return Path(input_path).samefile(output_path)
+    except OSError:
+        return False
+
 
 class FormatHandler:
     """Handles different input/output formats."""
@@ -25,10 +54,9 @@ class FormatHandler:
     def read_json(input_path: Optional[Path]) -> List[Dict[str, Any]]:
         """Read JSON format (list of verse objects)."""
         if input_path:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(input_path)
         else:
-            data = json.load(sys.stdin)
+            data = loads(sys.stdin.buffer.read())
         
         if not isinstance(data, list):
             raise ValueError("JSON input must be a list of verse objects")
@@ -36,44 +64,121 @@ class FormatHandler:
         return data
     
     @staticmethod
-    def read_pipe(input_path: Optional[Path]) -> List[str]:
-        """Read pipe format (one verse per line)."""
-        if input_path:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        else:
-            lines = sys.stdin.readlines()
-        
-        return [line.strip() for line in lines if line.strip()]
+    def iter_json(input_path: Optional[Path]) -> Iterator[Dict[str, Any]]:
+        """Read JSON format (list of verse objects), streaming verses when ijson is installed."""
+        f = open(input_path, 'rb') if input_path else sys.stdin.buffer
+        try:
+            yield from iter_array(f)
+        finally:
+            if input_path:
+                f.close()
+    
+    @staticmethod
+    def iter_jsonl(input_path: Optional[Path]) -> Iterator[Dict[str, Any]]:
+        """Read JSON Lines format (one verse object per line), one verse at a time."""
+        f = open(input_path, 'r', encoding='utf-8') if input_path else sys.stdin
+        try:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+        finally:
+            if input_path:
+                f.close()
+    
+    @staticmethod
+    def read_pipe(input_path: Optional[Path]) -> Iterator[str]:
+        """Read pipe format (one verse per line), yielding stripped non-blank lines."""
+        f = open(input_path, 'r', encoding='utf-8') if input_path else sys.stdin
+        try:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+        finally:
+            if input_path:
+                f.close()
     
     @staticmethod
     def write_plain(output_path: Optional[Path], text: str) -> None:
         """Write plain text to file or stdout."""
         if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
                 f.write(text)
         else:
             sys.stdout.write(text)
     
     @staticmethod
-    def write_json(output_path: Optional[Path], data: List[Dict[str, Any]]) -> None:
-        """Write JSON format."""
-        json_str = json.dumps(data, indent=2, ensure_ascii=False)
+    def write_json(output_path: Optional[Path], data: Iterable[Dict[str, Any]]) -> None:
+        """
+        Write JSON format, one array item at a time.
+        
+        The output is identical to json.dumps(list(data), indent=2,
+        ensure_ascii=False), but items are encoded with orjson when it is
+        installed and items from a generator are written as they are
+        produced. The first item is read before the output is opened, and
+        the output file is removed if a later item fails, so an error never
+        leaves a truncated file behind.
+        
+        Args:
+            output_path: Output file path (None for stdout)
+            data: Items of the top-level array
+        """
+        items = iter(data)
+        first = next(items, _MISSING)
         if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json_str)
+            try:
+                with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                    FormatHandler._write_json_items(f, first, items)
+            except BaseException:
+                # Don't leave a truncated array behind
+                Path(output_path).unlink(missing_ok=True)
+                raise
         else:
-            sys.stdout.write(json_str)
+            FormatHandler._write_json_items(sys.stdout, first, items)
+    
+    @staticmethod
+    def _write_json_items(f, first: Any, items: Iterator[Any]) -> None:
+        """Write an indented JSON array given its first item and the rest."""
+        if first is _MISSING:
+            f.write('[]')
+            return
+        # Encoded strings never contain raw newlines, so re-indenting each
+        # item's lines nests it one level inside the array
+        f.write('[\n  ')
+        f.write(dumps(first).decode('utf-8').replace('\n', '\n  '))
+        for item in items:
+            f.write(',\n  ')
+            f.write(dumps(item).decode('utf-8').replace('\n', '\n  '))
+        f.write('\n]')
     
     @staticmethod
-    def write_pipe(output_path: Optional[Path], lines: List[str]) -> None:
-        """Write pipe format (one verse per line)."""
-        text = '\n'.join(lines) + '\n'
+    def write_pipe(output_path: Optional[Path], lines: Iterable[str]) -> None:
+        """
+        Write pipe format (one verse per line).
+        
+        Lines are written as they are produced, so a generator is never
+        joined into one string first.
+        
+        Args:
+            output_path: Output file path (None for stdout)
+            lines: Lines to write, without trailing newlines
+        """
         if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                FormatHandler._write_lines(f, lines)
         else:
-            sys.stdout.write(text)
+            FormatHandler._write_lines(sys.stdout, lines)
+    
+    @staticmethod
+    def _write_lines(f, lines: Iterable[str]) -> None:
+        """Write newline-terminated lines (a lone newline if there are none)."""
+        wrote = False
+        for line in lines:
+            f.write(line)
+            f.write('\n')
+            wrote = True
+        if not wrote:
+            f.write('\n')
 
 
 class ConversionIO:
@@ -102,9 +207,7 @@ class ConversionIO:
             Report dict with conversion statistics
         """
         # Reset tracking
-        self.converter._applied_overrides = []
-        self.converter._heuristic_replacements = []
-        self.converter._ambiguous_lords = []
+        self.converter.reset_tracking()
         
         text = self.format_handler.read_plain(input_path)
         converted = self.converter.convert_text(text, strict=strict)
@@ -132,18 +235,32 @@ class ConversionIO:
         Returns:
             Report dict with conversion statistics
         """
-        verses = self.format_handler.read_json(input_path)
-        results = self.converter.batch_convert(verses, strict=strict)
-        self.format_handler.write_json(output_path, results)
+        verse_count = 0
+        changed_count = 0
         
-        changed_count = sum(1 for r in results if r['original'] != r['converted'])
+        def counted(results):
+            nonlocal verse_count, changed_count
+            for result in results:
+                verse_count += 1
+                if result['original'] != result['converted']:
+                    changed_count += 1
+                yield result
+        
+        # Verses are read, converted and written one at a time
+        verses = self.format_handler.iter_json(input_path)
+        if _same_file(input_path, output_path):
+            verses = list(verses)
+        self.format_handler.write_json(
+            output_path,
+            counted(self.converter.iter_convert(verses, strict=strict))
+        )
         
         # Build comprehensive report
         report = self._build_report('json', strict=strict)
         report.update({
-            'verse_count': len(verses),
+            'verse_count': verse_count,
             'changed_count': changed_count,
-            'unchanged_count': len(verses) - changed_count
+            'unchanged_count': verse_count - changed_count
         })
         
         return report
@@ -161,22 +278,33 @@ class ConversionIO:
             Report dict with conversion statistics
         """
         # Reset tracking
-        self.converter._applied_overrides = []
-        self.converter._heuristic_replacements = []
-        self.converter._ambiguous_lords = []
+        self.converter.reset_tracking()
         
-        lines = self.format_handler.read_pipe(input_path)
-        converted_lines = [self.converter.convert_text(line, strict=strict) for line in lines]
-        self.format_handler.write_pipe(output_path, converted_lines)
+        line_count = 0
+        changed_count = 0
+        convert = self.converter.convert_text
         
-        changed_count = sum(1 for orig, conv in zip(lines, converted_lines) if orig != conv)
+        def converted_lines(lines):
+            nonlocal line_count, changed_count
+            for line in lines:
+                converted = convert(line, strict=strict)
+                line_count += 1
+                if converted != line:
+                    changed_count += 1
+                yield converted
+        
+        # Lines are read, converted and written one at a time
+        lines = self.format_handler.read_pipe(input_path)
+        if _same_file(input_path, output_path):
+            lines = list(lines)
+        self.format_handler.write_pipe(output_path, converted_lines(lines))
         
         # Build comprehensive report
         report = self._build_report('pipe', strict=strict)
         report.update({
-            'line_count': len(lines),
+            'line_count': line_count,
             'changed_count': changed_count,
-            'unchanged_count': len(lines) - changed_count
+            'unchanged_count': line_count - changed_count
         })
         
         return report
@@ -203,26 +331,23 @@ class ConversionIO:
             report['applied_overrides'] = applied_overrides
             
             # Count replacements by type
-            replacement_counts = {}
+            replacement_counts = Counter()
             for override in applied_overrides:
-                replacements = override.get('replacements', {})
-                for original, replacement in replacements.items():
-                    if original != '__full_text__':
-                        key = f"{original} -> {replacement}"
-                        replacement_counts[key] = replacement_counts.get(key, 0) + 1
+                replacement_counts.update(
+                    f"{original} -> {replacement}"
+                    for original, replacement in override.get('replacements', {}).items()
+                    if original != '__full_text__'
+                )
             if replacement_counts:
-                report['replacement_counts'] = replacement_counts
+                report['replacement_counts'] = dict(replacement_counts)
         
         # Heuristic replacements
         heuristic_replacements = self.converter.get_heuristic_replacements()
         if heuristic_replacements:
             report['heuristic_replacements'] = heuristic_replacements
             # Count by type
-            heuristic_counts = {}
-            for hr in heuristic_replacements:
-                h_type = hr.get('type', 'unknown')
-                heuristic_counts[h_type] = heuristic_counts.get(h_type, 0) + 1
-            report['heuristic_counts'] = heuristic_counts
+            heuristic_counts = Counter(hr.get('type', 'unknown') for hr in heuristic_replacements)
+            report['heuristic_counts'] = dict(heuristic_counts)
         
         # Ambiguous Lord occurrences
         ambiguous_lords = self.converter.get_ambiguous_lords()
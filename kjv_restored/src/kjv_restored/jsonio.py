@@ -0,0 +1,109 @@
+"""JSON loading with optional orjson and ijson fast paths."""
+
+import json
+from itertools import chain
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Uses orjson when installed (about 3x faster on verse files), otherwise
+    the standard library parser. Both raise json.JSONDecodeError on bad input.
+    
+    Args:
+        data: JSON document, as UTF-8 bytes or text
+    
+    Returns:
+        Parsed JSON value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Path) -> Any:
+    """
+    Read and parse a JSON file.
+    
+    Args:
+        path: Path to JSON file
+    
+    Returns:
+        Parsed JSON value
+    """
+    return loads(Path(path).read_bytes())
+
+
+def iter_array(f: BinaryIO) -> Iterator[Any]:
+    """
+    Yield the items of a top-level JSON array.
+    
+    With ijson installed the array is parsed incrementally, so only one
+    item is in memory at a time; otherwise the whole document is parsed
+    first.
+    
+    Args:
+        f: Binary file object positioned at the start of the document
+    
+    Yields:
+        Array items in order
+    
+    Raises:
+        ValueError: If the document is not a JSON array
+    """
+    if not IJSON_AVAILABLE:
+        data = loads(f.read())
+        if not isinstance(data, list):
+            raise ValueError("JSON input must be a list")
+        yield from data
+        return
+    
+    events = ijson.parse(f, use_float=True)
+    first = next(events, None)
+    if first is None or first[1] != 'start_array':
+        raise ValueError("JSON input must be a list")
+    yield from ijson.items(chain([first], events), 'item')
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize to indented UTF-8 JSON.
+    
+    Matches json.dumps(data, indent=2, ensure_ascii=False); orjson is used
+    when installed.
+    
+    Args:
+        data: JSON-serializable value
+    
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def dump_json(data: Any, path: Path) -> None:
+    """
+    Write a value as an indented JSON file.
+    
+    Args:
+        data: JSON-serializable value
+        path: Output file path
+    """
+    Path(path).write_bytes(dumps(data))
@@ -4,6 +4,40 @@ import re
 from typing import List, Tuple, Dict
 
 
+# GOD (all caps) is case-sensitive, other tokens case-insensitive
+_CASE_SENSITIVE_TOKENS = frozenset({r'\bGOD\b'})
+
+
+def _fuse_mappings(patterns: List[Tuple[str, bool]]) -> re.Pattern:
+    """
+    Compile whole-word mappings into one alternation, one group per mapping.
+    
+    One pass is equivalent to applying the mappings one after another:
+    every pattern starts and ends on a word boundary, so matches of different
+    patterns can only overlap by starting at the same word; no replacement
+    contains a pattern; and replacements start and end with letters like the
+    text they replace. Alternatives keep the given order, so where matches
+    start together the earlier mapping wins (a phrase over its first word,
+    all-caps GOD over God), as it would applied first. The leading lookahead
+    lets the engine skip positions that cannot start a match.
+    
+    Args:
+        patterns: List of (pattern, ignore_case) pairs, each pattern
+            starting with \\b and a letter
+        
+    Returns:
+        Compiled pattern; match.lastindex is the 1-based mapping index
+    """
+    alternatives = []
+    for pattern, ignore_case in patterns:
+        if ignore_case:
+            alternatives.append(f'(?i:({pattern}))')
+        else:
+            alternatives.append(f'({pattern})')
+    first_letters = ''.join(sorted({pattern[2].lower() for pattern, _ in patterns}))
+    return re.compile(rf'\b(?=(?i:[{first_letters}]))(?:' + '|'.join(alternatives) + ')')
+
+
 class NameRules:
     """Defines the rules for converting KJV names to restored Hebrew names."""
     
@@ -24,6 +58,79 @@ class NameRules:
         (r'\bMessiah\b', "HA'MASHIACH"),
     ]
     
+    # PHRASE_MAPPINGS as a single pass
+    _FUSED_PHRASES = _fuse_mappings([(pattern, True) for pattern, _ in PHRASE_MAPPINGS])
+    _PHRASE_REPLACEMENTS = [None] + [replacement for _, replacement in PHRASE_MAPPINGS]
+    
+    # TOKEN_MAPPINGS as a single pass
+    _FUSED_TOKENS = _fuse_mappings([
+        (pattern, pattern not in _CASE_SENSITIVE_TOKENS) for pattern, _ in TOKEN_MAPPINGS
+    ])
+    _TOKEN_REPLACEMENTS = [None] + [replacement for _, replacement in TOKEN_MAPPINGS]
+    
+    # Phrases, tokens and "Lord" (apply_mappings) as a single pass; strict
+    # mode replaces a case-sensitive "Lord" match with itself
+    _NAME_PATTERNS = (
+        [(pattern, True) for pattern, _ in PHRASE_MAPPINGS]
+        + [(pattern, pattern not in _CASE_SENSITIVE_TOKENS) for pattern, _ in TOKEN_MAPPINGS]
+        + [(r'\bLord\b', False)]
+    )
+    _FUSED_NAMES = _fuse_mappings(_NAME_PATTERNS)
+    _NAME_REPLACEMENTS = (
+        [None]
+        + [replacement for _, replacement in PHRASE_MAPPINGS]
+        + [replacement for _, replacement in TOKEN_MAPPINGS]
+    )
+    _NAME_REPLACEMENTS_STRICT = _NAME_REPLACEMENTS + ['Lord']
+    _NAME_REPLACEMENTS = _NAME_REPLACEMENTS + ['ADON']
+    
+    # Patterns compiled once rather than looked up in re's cache per call
+    _LORD_RE = re.compile(r'\bLord\b')
+    _JAH_RE = re.compile(r'\bJAH\b', re.IGNORECASE)
+    # Case-preserving JAH -> YAH: all caps and title case keep their shape,
+    # any other casing becomes "yah"
+    _JAH_CASES = {'JAH': 'YAH', 'Jah': 'Yah'}
+    # "Praise ye the LORD." needs no pattern of its own: the period
+    # survives the replacement
+    _HALLELUJAH_RE = re.compile(r'Praise ye the LORD\b')
+    # Hallelu-jah and Hallelu-YAH spellings in one pass (a replacement
+    # never starts a new match, so two passes gave the same result)
+    _SHORT_FORM_PATTERN = r'\bHallelu\s*[jy]ah\b'
+    _SHORT_FORM_RE = re.compile(_SHORT_FORM_PATTERN, re.IGNORECASE)
+    
+    # apply_mappings then apply_short_form (apply_all) as a single pass: no
+    # name mapping matches a Hallelu spelling or produces one
+    _FUSED_ALL = _fuse_mappings(_NAME_PATTERNS + [(_SHORT_FORM_PATTERN, True)])
+    _ALL_REPLACEMENTS = _NAME_REPLACEMENTS + ['HalleluYAH']
+    _ALL_REPLACEMENTS_STRICT = _NAME_REPLACEMENTS_STRICT + ['HalleluYAH']
+    
+    # Every mapping above and in apply_short_form contains one of these words
+    # (lowercased). The case-insensitive patterns also match the characters in
+    # _PREFILTER_FOLDS, which lower() does not map onto ASCII letters.
+    _PREFILTER_WORDS = ('lord', 'god', 'jesus', 'christ', 'messiah', 'holy', 'hallelu')
+    _PREFILTER_FOLDS = ('\u0130', '\u0131', '\u017f')
+    
+    @staticmethod
+    def may_contain_names(text: str) -> bool:
+        """
+        Cheap prefilter for apply_mappings and apply_all.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            False only if no mapping can match text
+        """
+        # Plain loops: generator expressions with any() cost twice as much here
+        lowered = text.lower()
+        for word in NameRules._PREFILTER_WORDS:
+            if word in lowered:
+                return True
+        for char in NameRules._PREFILTER_FOLDS:
+            if char in text:
+                return True
+        return False
+    
     @staticmethod
     def apply_phrase_mappings(text: str) -> str:
         """
@@ -35,10 +142,8 @@ class NameRules:
         Returns:
             Text with phrases replaced
         """
-        result = text
-        for pattern, replacement in NameRules.PHRASE_MAPPINGS:
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-        return result
+        replacements = NameRules._PHRASE_REPLACEMENTS
+        return NameRules._FUSED_PHRASES.sub(lambda match: replacements[match.lastindex], text)
     
     @staticmethod
     def apply_token_mappings(text: str) -> str:
@@ -51,14 +156,8 @@ class NameRules:
         Returns:
             Text with tokens replaced
         """
-        result = text
-        for pattern, replacement in NameRules.TOKEN_MAPPINGS:
-            # GOD (all caps) should be case-sensitive, others case-insensitive
-            if pattern == r'\bGOD\b':
-                result = re.sub(pattern, replacement, result)  # Case-sensitive
-            else:
-                result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-        return result
+        replacements = NameRules._TOKEN_REPLACEMENTS
+        return NameRules._FUSED_TOKENS.sub(lambda match: replacements[match.lastindex], text)
     
     @staticmethod
     def apply_lord_mapping(text: str, strict_mode: bool = False) -> str:
@@ -79,7 +178,7 @@ class NameRules:
         
         # Match "Lord" (not all caps) as whole word
         # This matches "Lord" but not "LORD" (which is handled by token mappings)
-        result = re.sub(r'\bLord\b', 'ADON', text)
+        result = NameRules._LORD_RE.sub('ADON', text)
         return result
     
     @staticmethod
@@ -94,16 +193,16 @@ class NameRules:
         Returns:
             Text with names replaced
         """
-        # Apply phrases first (longer patterns)
-        result = NameRules.apply_phrase_mappings(text)
-        
-        # Apply single tokens (shorter patterns)
-        result = NameRules.apply_token_mappings(result)
-        
-        # Apply "Lord" mapping (ambiguous case)
-        result = NameRules.apply_lord_mapping(result, strict_mode=strict_mode)
+        if not NameRules.may_contain_names(text):
+            return text
         
-        return result
+        # One pass with the same result as phrases (longer patterns), then
+        # single tokens, then "Lord" (ambiguous case)
+        if strict_mode:
+            replacements = NameRules._NAME_REPLACEMENTS_STRICT
+        else:
+            replacements = NameRules._NAME_REPLACEMENTS
+        return NameRules._FUSED_NAMES.sub(lambda match: replacements[match.lastindex], text)
     
     @staticmethod
     def convert_jah_to_yah(text: str) -> Tuple[str, bool]:
@@ -117,24 +216,15 @@ class NameRules:
         Returns:
             Tuple of (converted_text, was_changed)
         """
-        # Match JAH as a word boundary token, preserving case
-        # Pattern matches: JAH, jah, Jah, etc. but not as part of other words
-        original = text
-        
-        def replace_jah(match):
-            matched = match.group(0)
-            # Preserve case: if all caps, return YAH; if title case, return Yah; if lowercase, return yah
-            if matched.isupper():
-                return 'YAH'
-            elif matched[0].isupper() and matched[1:].islower():
-                return 'Yah'
-            else:
-                return 'yah'
-        
-        # Use case-insensitive flag but preserve original case via replacement function
-        result = re.sub(r'\bJAH\b', replace_jah, text, flags=re.IGNORECASE)
-        was_changed = result != original
-        return result, was_changed
+        if 'jah' not in text.lower():
+            return text, False
+        
+        # Every match is one of the eight casings of "jah" (no other
+        # characters fold onto j, a or h), so the replacement is a table
+        # lookup and every match changes the text
+        cases = NameRules._JAH_CASES
+        result, count = NameRules._JAH_RE.subn(lambda match: cases.get(match.group(), 'yah'), text)
+        return result, count > 0
     
     @staticmethod
     def apply_hallelujah_heuristic(text: str) -> Tuple[str, bool]:
@@ -147,19 +237,13 @@ class NameRules:
         Returns:
             Tuple of (converted_text, was_changed)
         """
-        original = text
-        # Match "Praise ye the LORD." and "Praise ye the LORD" (with or without period)
-        patterns = [
-            (r'Praise ye the LORD\.', 'Hallelu-YAH.'),
-            (r'Praise ye the LORD\b', 'Hallelu-YAH'),
-        ]
+        # Plain substring test first; most text has no such phrase
+        if 'Praise ye the LORD' not in text:
+            return text, False
         
-        result = text
-        for pattern, replacement in patterns:
-            result = re.sub(pattern, replacement, result)
-        
-        was_changed = result != original
-        return result, was_changed
+        # Match "Praise ye the LORD." and "Praise ye the LORD" (with or without period)
+        result, count = NameRules._HALLELUJAH_RE.subn('Hallelu-YAH', text)
+        return result, count > 0
     
     @staticmethod
     def apply_short_form(text: str) -> str:
@@ -172,9 +256,10 @@ class NameRules:
         Returns:
             Text with short forms applied
         """
-        # Check for Hallelujah patterns
-        text = re.sub(r'\bHallelu\s*jah\b', 'HalleluYAH', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bHallelu\s*YAH\b', 'HalleluYAH', text, flags=re.IGNORECASE)
+        # Check for Hallelujah patterns (no other letters fold onto
+        # "hallelu" case-insensitively, so lower() is a safe prefilter)
+        if 'hallelu' in text.lower():
+            text = NameRules._SHORT_FORM_RE.sub('HalleluYAH', text)
         
         # In certain contexts, YAHUAH might be shortened to YAH
         # This is context-dependent and can be overridden per verse
@@ -192,7 +277,14 @@ class NameRules:
         Returns:
             Fully converted text
         """
-        result = NameRules.apply_mappings(text, strict_mode=strict_mode)
-        result = NameRules.apply_short_form(result)
-        return result
+        # Most verses name no one; skip the regex passes for them entirely
+        if not NameRules.may_contain_names(text):
+            return text
+        
+        # Same result as apply_mappings followed by apply_short_form
+        if strict_mode:
+            replacements = NameRules._ALL_REPLACEMENTS_STRICT
+        else:
+            replacements = NameRules._ALL_REPLACEMENTS
+        return NameRules._FUSED_ALL.sub(lambda match: replacements[match.lastindex], text)
 
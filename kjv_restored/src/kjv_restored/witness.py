@@ -1,33 +1,66 @@
 """Witness management for verse overrides."""
 
+import contextlib
+import functools
 import re
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
+
+from kjv_restored.jsonio import dump_json, load_json
+
+
+_YAH_RE = re.compile(r'\bYAH\b')
+_YAHUAH_RE = re.compile(r'\bYAHUAH\b')
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_yah_short(replacement: str) -> bool:
+    """
+    Check if an override replacement string uses the YAH short form.
+    
+    Override files repeat a handful of replacement strings, so results
+    are cached.
+    
+    Args:
+        replacement: Replacement value from an override
+        
+    Returns:
+        True if the replacement is "YAH", or contains YAH but not YAHUAH
+    """
+    return replacement == "YAH" or (bool(_YAH_RE.search(replacement)) and
+                                    not _YAHUAH_RE.search(replacement))
 
 
 class WitnessManager:
     """Manages witness metadata for verse overrides."""
     
-    VALID_WITNESSES = ["cepher", "dabar_yahuah", "kjv_token"]
+    VALID_WITNESSES: FrozenSet[str] = frozenset({"cepher", "dabar_yahuah", "kjv_token"})
     
-    def __init__(self, overrides_file: Optional[Path] = None):
+    def __init__(self, overrides_file: Optional[Path] = None, overrides: Optional[Dict[str, Dict]] = None):
         """
         Initialize witness manager.
         
         Args:
             overrides_file: Path to overrides.json file
+            overrides: Overrides to use instead of loading overrides_file
+                (edits are still saved to overrides_file)
         """
         self.overrides_file = overrides_file or Path("overrides.json")
         self.overrides: Dict[str, Dict] = {}
-        self.load_overrides()
+        # add_override/remove_override defer saving while inside batch()
+        self._batch_depth = 0
+        self._dirty = False
+        if overrides is None:
+            self.load_overrides()
+        else:
+            self.overrides = dict(overrides)
     
     def load_overrides(self) -> None:
         """Load overrides from JSON file if it exists."""
         if self.overrides_file.exists():
             try:
-                with open(self.overrides_file, 'r', encoding='utf-8') as f:
-                    self.overrides = json.load(f)
+                self.overrides = load_json(self.overrides_file)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Could not load overrides: {e}")
                 self.overrides = {}
@@ -38,8 +71,8 @@ class WitnessManager:
         """Save overrides to JSON file."""
         # Ensure parent directory exists
         self.overrides_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.overrides_file, 'w', encoding='utf-8') as f:
-            json.dump(self.overrides, f, indent=2, ensure_ascii=False)
+        self._dirty = False
+        dump_json(self.overrides, self.overrides_file)
     
     def validate_witnesses(self, witnesses: List[str]) -> List[str]:
         """
@@ -99,7 +132,7 @@ class WitnessManager:
             'witnesses': validated_witnesses,
             'require_witness': require_witness
         }
-        self.save_overrides()
+        self._changed()
     
     def remove_override(self, verse_ref: str) -> bool:
         """
@@ -113,10 +146,34 @@ class WitnessManager:
         """
         if verse_ref in self.overrides:
             del self.overrides[verse_ref]
-            self.save_overrides()
+            self._changed()
             return True
         return False
     
+    def _changed(self) -> None:
+        """Save overrides after an edit, or mark them unsaved inside batch()."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save_overrides()
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Defer saving overrides until the block exits.
+        
+        add_override and remove_override normally rewrite the whole
+        overrides file; inside ``with manager.batch():`` the file is written
+        once at the end. Blocks may be nested; only the outermost one saves.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.save_overrides()
+    
     def has_yah_short_form(self, text: str) -> bool:
         """
         Check if text contains YAH short form (YAH instead of YAHUAH for LORD).
@@ -145,6 +202,29 @@ class WitnessManager:
         """
         return "cepher" in witnesses and "dabar_yahuah" in witnesses
     
+    def should_apply_override(self, verse_ref: str, enforce_witnesses: bool = False) -> Optional[str]:
+        """
+        Get the replacement text of a verse's override if it should be applied.
+        
+        Only single "replacement" overrides have replacement text; use
+        get_replacements for the "replacements" format.
+        
+        Args:
+            verse_ref: Verse reference
+            enforce_witnesses: If True, only apply overrides with witnesses
+        
+        Returns:
+            Replacement text, or None if no override applies
+        """
+        override = self.get_override(verse_ref)
+        if not override:
+            return None
+        
+        if enforce_witnesses and not override.get('witnesses', []):
+            return None
+        
+        return override.get('replacement') or None
+    
     def get_replacements(
         self,
         verse_ref: str,
@@ -184,16 +264,12 @@ class WitnessManager:
             # Convert to new format
             replacements = {'__full_text__': replacement}
         
-        # Validate YAH replacements in witnessed mode
-        if short_name_mode == "witnessed":
-            for original, replacement in replacements.items():
-                # Check if replacement is "YAH" (short form)
-                if replacement == "YAH" or (isinstance(replacement, str) and 
-                                            re.search(r'\bYAH\b', replacement) and 
-                                            not re.search(r'\bYAHUAH\b', replacement)):
-                    # Require both witnesses for YAH replacements
-                    if not self.has_both_witnesses(witnesses):
-                        return None  # Reject YAH-short override without both witnesses
+        # Validate YAH replacements in witnessed mode: YAH-short overrides
+        # require both witnesses
+        if short_name_mode == "witnessed" and not self.has_both_witnesses(witnesses):
+            if any(isinstance(replacement, str) and _is_yah_short(replacement)
+                   for replacement in replacements.values()):
+                return None  # Reject YAH-short override without both witnesses
         
         return replacements
 
@@ -1,23 +1,138 @@
 """Automated witness checking against local Bible files."""
 
-import json
+import functools
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from collections import defaultdict
 
 from kjv_restored.books import normalize_book_name
+from kjv_restored.jsonio import load_json
 
 try:
     from docx import Document
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.oxml.ns import qn
     DOCX_AVAILABLE = True
 except ImportError:
     DOCX_AVAILABLE = False
 
 
+# KJV tokens _suggest_replacements looks for, found in one scan (each
+# alternative matches different words, so no occurrence hides another)
+_KJV_TOKENS_RE = re.compile(
+    r'\b(?:(?P<LORD>LORD)|(?P<God>(?i:God))|(?P<Jesus>Jesus)|(?P<Christ>Christ)'
+    r'|(?P<Holy>Holy\s+(?:Spirit|Ghost)))\b'
+)
+
+
+# Restored names whose witness presence decides the suggestions
+_SUGGESTION_NAMES = ('YAHUAH', 'YAH', 'ELOHIYM', 'YAHUSHA', "HA'MASHIACH", 'RUACH HAQODESH')
+
+
+@functools.lru_cache(maxsize=4096)
+def _suggestions_for(present: FrozenSet[str], found: Tuple[Tuple[bool, bool], ...],
+                     witnesses: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Suggested replacements for one combination of tokens and witness names.
+    
+    Only a few dozen combinations occur across a whole Bible, so the
+    decisions are cached instead of being re-made for every verse.
+    
+    Args:
+        present: KJV tokens found in the verse (_KJV_TOKENS_RE group names)
+        found: (cepher, dabar_yahuah) presence for each of _SUGGESTION_NAMES
+        witnesses: Available witnesses
+        
+    Returns:
+        Dictionary of suggested replacements: {original_token: replacement}
+    """
+    yahuah, yah, elohiym, yahusha, mashiach, ruach = found
+    witnessed_yahuah = dict(zip(('cepher', 'dabar_yahuah'), yahuah))
+    suggestions = {}
+    
+    # Check for LORD -> YAHUAH or YAH
+    if 'LORD' in present:
+        # If both witnesses have YAHUAH, suggest YAHUAH
+        if all(yahuah):
+            suggestions['LORD'] = 'YAHUAH'
+        # If both have YAH (short form), suggest YAH
+        elif all(yah):
+            suggestions['LORD'] = 'YAH'
+        # If only one witness, be conservative
+        elif len(witnesses) == 1 and witnessed_yahuah.get(witnesses[0]):
+            suggestions['LORD'] = 'YAHUAH'
+    
+    # Check for God -> YAHUAH or ELOHIYM
+    if 'God' in present:
+        # If both witnesses have YAHUAH, suggest YAHUAH
+        if all(yahuah):
+            suggestions['God'] = 'YAHUAH'
+        # If both have ELOHIYM, suggest ELOHIYM
+        elif all(elohiym):
+            suggestions['God'] = 'ELOHIYM'
+    
+    # Check for Jesus -> YAHUSHA
+    if 'Jesus' in present and any(yahusha):
+        suggestions['Jesus'] = 'YAHUSHA'
+    
+    # Check for Christ -> HA'MASHIACH
+    if 'Christ' in present and any(mashiach):
+        suggestions['Christ'] = "HA'MASHIACH"
+    
+    # Check for Holy Spirit/Ghost -> RUACH HAQODESH
+    if 'Holy' in present and any(ruach):
+        suggestions['Holy Spirit'] = 'RUACH HAQODESH'
+        suggestions['Holy Ghost'] = 'RUACH HAQODESH'
+    
+    return suggestions
+
+
+# Chapter headings and inline-numbered verses in witness DOCX files
+_CHAPTER_RE = re.compile(r'Chapter\s+(\d+)', re.IGNORECASE)
+_VERSE_RE = re.compile(r'^(\d+)\s+(.+)$')
+
+
+def _paragraph_style_names(doc) -> List[str]:
+    """
+    Style name of each paragraph in doc.paragraphs, in the same order.
+    
+    Paragraph.style scans the whole styles part for every paragraph, which
+    dominates load time for a Bible-sized file. Here paragraph style names
+    are mapped once from doc.styles and each paragraph's style id is read
+    from the document XML (doc.element); a missing or unknown id falls back
+    to the default paragraph style, as Paragraph.style does.
+    
+    Args:
+        doc: python-docx Document
+        
+    Returns:
+        Style names aligned with doc.paragraphs
+    """
+    names = {
+        style.style_id: style.name
+        for style in doc.styles
+        if style.type == WD_STYLE_TYPE.PARAGRAPH
+    }
+    default = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+    default_name = default.name if default is not None else ''
+    
+    p_tag, ppr_tag, pstyle_tag, val_attr = qn('w:p'), qn('w:pPr'), qn('w:pStyle'), qn('w:val')
+    style_names = []
+    for p in doc.element.body.iterchildren(p_tag):
+        ppr = p.find(ppr_tag)
+        pstyle = ppr.find(pstyle_tag) if ppr is not None else None
+        style_id = pstyle.get(val_attr) if pstyle is not None else None
+        style_names.append(names.get(style_id, default_name))
+    return style_names
+
+
 class WitnessChecker:
     """Checks verses against local witness Bible files."""
     
+    # Restored names looked for in witness texts (substring match)
+    NAMES_TO_CHECK = ('YAHUAH', 'YAH', 'YAHUSHA', "HA'MASHIACH", 'RUACH HAQODESH', 'ELOHIYM', 'ADON')
+    
     def __init__(self, cepher_file: Optional[Path] = None, dabar_yahuah_file: Optional[Path] = None):
         """
         Initialize witness checker.
@@ -28,17 +143,37 @@ class WitnessChecker:
         """
         self.cepher_file = cepher_file
         self.dabar_yahuah_file = dabar_yahuah_file
-        self.cepher_verses: Dict[str, str] = {}
-        self.dabar_yahuah_verses: Dict[str, str] = {}
-        self._load_witnesses()
+        # Witness files are loaded on first use
+        self._cepher_verses: Optional[Dict[str, str]] = None
+        self._dabar_yahuah_verses: Optional[Dict[str, str]] = None
     
-    def _load_witnesses(self):
-        """Load witness Bible files into memory."""
-        if self.cepher_file and self.cepher_file.exists():
-            self.cepher_verses = self._load_bible_file(self.cepher_file)
-        
-        if self.dabar_yahuah_file and self.dabar_yahuah_file.exists():
-            self.dabar_yahuah_verses = self._load_bible_file(self.dabar_yahuah_file)
+    @property
+    def cepher_verses(self) -> Dict[str, str]:
+        """Cepher verses by verse key, loaded on first access."""
+        if self._cepher_verses is None:
+            self._cepher_verses = self._load_witness(self.cepher_file)
+        return self._cepher_verses
+    
+    @cepher_verses.setter
+    def cepher_verses(self, verses: Dict[str, str]):
+        self._cepher_verses = verses
+    
+    @property
+    def dabar_yahuah_verses(self) -> Dict[str, str]:
+        """Dâbâr Yahuah verses by verse key, loaded on first access."""
+        if self._dabar_yahuah_verses is None:
+            self._dabar_yahuah_verses = self._load_witness(self.dabar_yahuah_file)
+        return self._dabar_yahuah_verses
+    
+    @dabar_yahuah_verses.setter
+    def dabar_yahuah_verses(self, verses: Dict[str, str]):
+        self._dabar_yahuah_verses = verses
+    
+    def _load_witness(self, file_path: Optional[Path]) -> Dict[str, str]:
+        """Load a witness Bible file, or nothing if it is not configured or missing."""
+        if file_path and file_path.exists():
+            return self._load_bible_file(file_path)
+        return {}
     
     def _load_bible_file(self, file_path: Path) -> Dict[str, str]:
         """
@@ -70,8 +205,7 @@ class WitnessChecker:
         """Load JSON Bible file."""
         verses = {}
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(file_path)
             
             if isinstance(data, list):
                 for verse_obj in data:
@@ -112,13 +246,13 @@ class WitnessChecker:
             current_verse = None
             verse_text_parts = []
             
-            for para in doc.paragraphs:
+            for para, style_name in zip(doc.paragraphs, _paragraph_style_names(doc), strict=True):
                 text = para.text.strip()
                 if not text:
                     continue
                 
                 # Check if this is a book heading (Heading 1 style or all caps)
-                if para.style.name.startswith('Heading 1') or (text.isupper() and len(text) < 50):
+                if style_name.startswith('Heading 1') or (text.isupper() and len(text) < 50):
                     # Might be a book name
                     normalized = normalize_book_name(text)
                     if normalized:  # If it matches a known book
@@ -129,8 +263,8 @@ class WitnessChecker:
                     continue
                 
                 # Check if this is a chapter heading (Heading 2 style or "Chapter X")
-                chapter_match = re.search(r'Chapter\s+(\d+)', text, re.IGNORECASE)
-                if chapter_match or para.style.name.startswith('Heading 2'):
+                chapter_match = _CHAPTER_RE.search(text) if 'chapter' in text.lower() else None
+                if chapter_match or style_name.startswith('Heading 2'):
                     if chapter_match:
                         current_chapter = int(chapter_match.group(1))
                     current_verse = None
@@ -139,7 +273,7 @@ class WitnessChecker:
                 
                 # Try to extract verse number and text
                 # Pattern: verse number (superscript or inline) followed by text
-                verse_match = re.match(r'^(\d+)\s+(.+)$', text)
+                verse_match = _VERSE_RE.match(text) if text[0].isdigit() else None
                 if verse_match:
                     verse_num = int(verse_match.group(1))
                     verse_text = verse_match.group(2)
@@ -226,15 +360,17 @@ class WitnessChecker:
         }
         
         # Check Cepher
-        if verse_key in self.cepher_verses:
+        cepher_verses = self.cepher_verses
+        if verse_key in cepher_verses:
             result['cepher_found'] = True
-            result['cepher_text'] = self.cepher_verses[verse_key]
+            result['cepher_text'] = cepher_verses[verse_key]
             result['witnesses'].append('cepher')
         
         # Check Dâbâr Yahuah
-        if verse_key in self.dabar_yahuah_verses:
+        dabar_yahuah_verses = self.dabar_yahuah_verses
+        if verse_key in dabar_yahuah_verses:
             result['dabar_yahuah_found'] = True
-            result['dabar_yahuah_text'] = self.dabar_yahuah_verses[verse_key]
+            result['dabar_yahuah_text'] = dabar_yahuah_verses[verse_key]
             result['witnesses'].append('dabar_yahuah')
         
         # Analyze name usage
@@ -264,16 +400,17 @@ class WitnessChecker:
                 ...
             }
         """
-        names_to_check = ['YAHUAH', 'YAH', 'YAHUSHA', "HA'MASHIACH", 'RUACH HAQODESH', 'ELOHIYM', 'ADON']
-        matches = {}
+        # A missing witness contains no names
+        cepher_text = cepher_text or ''
+        dabar_yahuah_text = dabar_yahuah_text or ''
         
-        for name in names_to_check:
-            matches[name] = {
-                'cepher': bool(cepher_text and name in cepher_text),
-                'dabar_yahuah': bool(dabar_yahuah_text and name in dabar_yahuah_text)
+        return {
+            name: {
+                'cepher': name in cepher_text,
+                'dabar_yahuah': name in dabar_yahuah_text
             }
-        
-        return matches
+            for name in self.NAMES_TO_CHECK
+        }
     
     def _suggest_replacements(self, kjv_text: str, name_matches: Dict, witnesses: List[str]) -> Dict[str, str]:
         """
@@ -287,46 +424,17 @@ class WitnessChecker:
         Returns:
             Dictionary of suggested replacements: {original_token: replacement}
         """
-        suggestions = {}
-        
-        # Check for LORD -> YAHUAH or YAH
-        if re.search(r'\bLORD\b', kjv_text):
-            # If both witnesses have YAHUAH, suggest YAHUAH
-            if name_matches.get('YAHUAH', {}).get('cepher') and name_matches.get('YAHUAH', {}).get('dabar_yahuah'):
-                suggestions['LORD'] = 'YAHUAH'
-            # If both have YAH (short form), suggest YAH
-            elif name_matches.get('YAH', {}).get('cepher') and name_matches.get('YAH', {}).get('dabar_yahuah'):
-                suggestions['LORD'] = 'YAH'
-            # If only one witness, be conservative
-            elif len(witnesses) == 1 and name_matches.get('YAHUAH', {}).get(witnesses[0]):
-                suggestions['LORD'] = 'YAHUAH'
-        
-        # Check for God -> YAHUAH or ELOHIYM
-        if re.search(r'\bGod\b', kjv_text, re.IGNORECASE):
-            # If both witnesses have YAHUAH, suggest YAHUAH
-            if name_matches.get('YAHUAH', {}).get('cepher') and name_matches.get('YAHUAH', {}).get('dabar_yahuah'):
-                suggestions['God'] = 'YAHUAH'
-            # If both have ELOHIYM, suggest ELOHIYM
-            elif name_matches.get('ELOHIYM', {}).get('cepher') and name_matches.get('ELOHIYM', {}).get('dabar_yahuah'):
-                suggestions['God'] = 'ELOHIYM'
-        
-        # Check for Jesus -> YAHUSHA
-        if re.search(r'\bJesus\b', kjv_text):
-            if name_matches.get('YAHUSHA', {}).get('cepher') or name_matches.get('YAHUSHA', {}).get('dabar_yahuah'):
-                suggestions['Jesus'] = 'YAHUSHA'
-        
-        # Check for Christ -> HA'MASHIACH
-        if re.search(r'\bChrist\b', kjv_text):
-            if name_matches.get("HA'MASHIACH", {}).get('cepher') or name_matches.get("HA'MASHIACH", {}).get('dabar_yahuah'):
-                suggestions['Christ'] = "HA'MASHIACH"
-        
-        # Check for Holy Spirit/Ghost -> RUACH HAQODESH
-        if re.search(r'\bHoly\s+(?:Spirit|Ghost)\b', kjv_text):
-            if name_matches.get('RUACH HAQODESH', {}).get('cepher') or name_matches.get('RUACH HAQODESH', {}).get('dabar_yahuah'):
-                suggestions['Holy Spirit'] = 'RUACH HAQODESH'
-                suggestions['Holy Ghost'] = 'RUACH HAQODESH'
+        present = frozenset(match.lastgroup for match in _KJV_TOKENS_RE.finditer(kjv_text))
+        if not present:
+            return {}
         
-        return suggestions
+        found = tuple(
+            (bool(name_matches.get(name, {}).get('cepher')),
+             bool(name_matches.get(name, {}).get('dabar_yahuah')))
+            for name in _SUGGESTION_NAMES
+        )
+        # Copied so callers can edit their result without touching the cache
+        return dict(_suggestions_for(present, found, tuple(witnesses)))
     
     def check_batch(self, verses: List[Dict]) -> List[Dict]:
         """
@@ -0,0 +1,86 @@
+"""Shared fixtures for the test suite."""
+
+import functools
+import json
+from pathlib import Path
+
+import pytest
+
+from kjv_restored.assembler import BibleAssembler
+from kjv_restored.checklist import ChecklistGenerator
+from kjv_restored.books import sort_verses
+from kjv_restored.config import Config
+from kjv_restored.converter import RestoredNamesConverter
+
+
+@pytest.fixture(scope="session")
+def default_converter():
+    """Converter with the default config, shared by tests that only read from it."""
+    return RestoredNamesConverter()
+
+
+@pytest.fixture(scope="session")
+def strict_converter():
+    """Converter in strict mode, shared by tests that only read from it."""
+    return RestoredNamesConverter(config=Config(strict_mode=True))
+
+
+@pytest.fixture(scope="module")
+def assembler(default_converter):
+    """Assembler over the shared default converter (call reset() before checking stats)."""
+    return BibleAssembler(default_converter)
+
+
+@pytest.fixture(scope="session")
+def converter_factory():
+    """
+    Build converters from Config keyword arguments, one per distinct setting.
+    
+    Values must be hashable (pass overrides through Config directly instead).
+    Converters are shared, so tests that check tracking should call
+    reset_tracking() first.
+    """
+    @functools.lru_cache(maxsize=None)
+    def build(**settings):
+        return RestoredNamesConverter(config=Config(**settings))
+    
+    return build
+
+
+@pytest.fixture(scope="session")
+def overrides_file(tmp_path_factory):
+    """
+    Read-only overrides.json written once per session.
+    
+    John 3:16 has a witness and John 1:1 has none. Tests that edit
+    overrides should write their own file under tmp_path.
+    """
+    path = tmp_path_factory.mktemp("overrides") / "overrides.json"
+    path.write_text(json.dumps({
+        "John 3:16": {
+            "replacement": "With witness",
+            "witnesses": ["cepher"],
+            "require_witness": False
+        },
+        "John 1:1": {
+            "replacement": "Without witness",
+            "witnesses": [],
+            "require_witness": False
+        }
+    }), encoding='utf-8')
+    return path
+
+
+@pytest.fixture(scope="module")
+def checklist_gen():
+    """Checklist generator shared by the tests of a module."""
+    return ChecklistGenerator()
+
+
+@pytest.fixture(scope="session")
+def mini_kjv_verses():
+    """Verses of data/mini_kjv.json in canonical order, parsed once per session."""
+    path = Path(__file__).parent.parent / "data" / "mini_kjv.json"
+    if not path.exists():
+        pytest.skip("mini_kjv.json not found")
+    return sort_verses(json.loads(path.read_bytes()))
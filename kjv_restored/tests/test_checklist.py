@@ -1,65 +1,47 @@
 """Tests for checklist generation."""
 
 import pytest
-import tempfile
 import json
-from pathlib import Path
-
-from kjv_restored.checklist import ChecklistGenerator
 
 
 class TestChecklistGenerator:
     """Test checklist generation functionality."""
     
-    def test_scan_verse_lord_ambiguous(self):
-        """Test scanning for ambiguous 'Lord' token."""
-        generator = ChecklistGenerator()
-        
-        items = generator.scan_verse(
-            "For whosoever shall call upon the name of the Lord shall be saved.",
-            "Romans", 10, 13
-        )
-        
-        assert len(items) > 0
-        lord_item = next((item for item in items if item['needs'] == 'Lord decision'), None)
-        assert lord_item is not None
-        assert lord_item['ref'] == "Romans 10:13"
-        assert 'YAHUAH' in lord_item['suggested']
-        assert 'cepher' in lord_item['witnesses_required']
-        assert 'dabar_yahuah' in lord_item['witnesses_required']
-    
-    def test_scan_verse_hallelujah_candidate(self):
-        """Test scanning for hallelujah heuristic candidate."""
-        generator = ChecklistGenerator()
-        
-        items = generator.scan_verse(
-            "Praise ye the LORD.",
-            "Psalms", 150, 1
-        )
-        
-        assert len(items) > 0
-        hallelujah_item = next((item for item in items if 'Hallelujah' in item['needs']), None)
-        assert hallelujah_item is not None
-        assert 'Hallelu-YAH' in hallelujah_item['suggested']
-    
-    def test_scan_verse_jah_token(self):
-        """Test scanning for JAH token."""
-        generator = ChecklistGenerator()
-        
-        items = generator.scan_verse(
-            "Sing unto JAH, sing praises to JAH.",
-            "Psalm", 68, 4
-        )
+    @pytest.mark.parametrize(
+        "text,ref,needs,suggested,witnesses",
+        [
+            pytest.param(
+                "For whosoever shall call upon the name of the Lord shall be saved.",
+                ("Romans", 10, 13), "Lord decision", "YAHUAH", ["cepher", "dabar_yahuah"],
+                id="lord_ambiguous"
+            ),
+            pytest.param(
+                "Praise ye the LORD.",
+                ("Psalms", 150, 1), "Hallelujah", "Hallelu-YAH", [],
+                id="hallelujah_candidate"
+            ),
+            pytest.param(
+                "Sing unto JAH, sing praises to JAH.",
+                ("Psalm", 68, 4), "JAH token", "YAH", ["kjv_token"],
+                id="jah_token"
+            ),
+        ]
+    )
+    def test_scan_verse_single_issue(self, checklist_gen, text, ref, needs, suggested, witnesses):
+        """Test scanning a verse with one kind of token needing review."""
+        items = checklist_gen.scan_verse(text, *ref)
         
         assert len(items) > 0
-        jah_item = next((item for item in items if 'JAH token' in item['needs']), None)
-        assert jah_item is not None
-        assert jah_item['ref'] == "Psalm 68:4"
-        assert 'kjv_token' in jah_item['witnesses_required']
+        item = next((item for item in items if needs in item['needs']), None)
+        assert item is not None
+        assert item['ref'] == "{} {}:{}".format(*ref)
+        assert suggested in item['suggested']
+        for witness in witnesses:
+            assert witness in item['witnesses_required']
     
-    def test_scan_verse_multiple_issues(self):
+    def test_scan_verse_multiple_issues(self, checklist_gen):
         """Test scanning verse with multiple issues."""
-        generator = ChecklistGenerator()
+        generator = checklist_gen
         
         items = generator.scan_verse(
             "Praise ye the LORD, O my soul. The Lord is good.",
@@ -72,124 +54,177 @@ class TestChecklistGenerator:
         assert any('Hallelujah' in need for need in needs)
         assert any('Lord decision' in need for need in needs)
     
-    def test_generate_checklist_from_json(self):
+    def test_scan_verses_matches_scan_verse(self, checklist_gen):
+        """Test that batch scanning gives the same items as scanning verse by verse."""
+        texts = [
+            "For whosoever shall call upon the name of the Lord shall be saved.",
+            "In the beginning God created the heaven and the earth.",
+            "Praise ye the LORD, O my soul. The Lord is good.",
+            "Sing unto JAH, sing praises to JAH.",
+        ]
+        refs = [("Romans", 10, 13), ("Genesis", 1, 1), ("Psalms", 103, 1), ("Psalm", 68, 4)]
+        
+        expected = [item for text, ref in zip(texts, refs) for item in checklist_gen.scan_verse(text, *ref)]
+        assert checklist_gen.scan_verses(texts, refs) == expected
+    
+    def test_scan_verses_length_mismatch(self, checklist_gen):
+        """Test that batch scanning rejects texts and refs of different lengths."""
+        texts = ["O Lord", "Sing unto JAH"]
+        
+        with pytest.raises(ValueError):
+            checklist_gen.scan_verses(texts, [("Romans", 2, 1)])
+        with pytest.raises(ValueError):
+            checklist_gen.scan_verses(texts[:1], [("Romans", 2, 1), ("Psalm", 68, 4)])
+    
+    def test_generate_checklist_from_json(self, tmp_path, checklist_gen):
         """Test generating checklist from JSON input."""
-        generator = ChecklistGenerator()
-        
-        # Create temporary input file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as input_file:
-            verses = [
-                {
-                    "book": "Romans",
-                    "chapter": 10,
-                    "verse": 13,
-                    "text": "For whosoever shall call upon the name of the Lord shall be saved."
-                },
-                {
-                    "book": "Psalm",
-                    "chapter": 68,
-                    "verse": 4,
-                    "text": "Sing unto JAH, sing praises to JAH."
-                }
-            ]
-            json.dump(verses, input_file)
-            input_path = Path(input_file.name)
-        
-        # Create temporary output file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as output_file:
-            output_path = Path(output_file.name)
-        
-        try:
-            checklist = generator.generate_checklist(input_path, output_path)
-            
-            # Should have items
-            assert len(checklist) > 0
-            
-            # Verify output file was created
-            assert output_path.exists()
-            
-            # Verify output content
-            with open(output_path, 'r', encoding='utf-8') as f:
-                saved_checklist = json.load(f)
-            
-            assert len(saved_checklist) == len(checklist)
-            
-            # Check that items are sorted by reference
-            refs = [item['ref'] for item in saved_checklist]
-            assert refs == sorted(refs)
-            
-        finally:
-            input_path.unlink()
-            output_path.unlink()
+        generator = checklist_gen
+        
+        input_path = tmp_path / "verses.json"
+        output_path = tmp_path / "checklist.json"
+        verses = [
+            {
+                "book": "Romans",
+                "chapter": 10,
+                "verse": 13,
+                "text": "For whosoever shall call upon the name of the Lord shall be saved."
+            },
+            {
+                "book": "Psalm",
+                "chapter": 68,
+                "verse": 4,
+                "text": "Sing unto JAH, sing praises to JAH."
+            }
+        ]
+        input_path.write_text(json.dumps(verses), encoding='utf-8')
+        
+        checklist = generator.generate_checklist(input_path, output_path)
+        
+        # Should have items
+        assert len(checklist) > 0
+        
+        # Verify output file was created
+        assert output_path.exists()
+        
+        # Verify output content
+        with open(output_path, 'r', encoding='utf-8') as f:
+            saved_checklist = json.load(f)
+        
+        assert len(saved_checklist) == len(checklist)
+        
+        # Check that items are in canonical order (Psalms before Romans)
+        refs = [item['ref'] for item in saved_checklist]
+        assert refs == ["Psalm 68:4", "Romans 10:13"]
     
-    def test_checklist_no_duplicates(self):
+    def test_checklist_no_duplicates(self, tmp_path, checklist_gen):
         """Test that checklist removes duplicates."""
-        generator = ChecklistGenerator()
+        generator = checklist_gen
         
         # Create input with same verse appearing multiple times
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as input_file:
-            verses = [
-                {
-                    "book": "Romans",
-                    "chapter": 10,
-                    "verse": 13,
-                    "text": "For whosoever shall call upon the name of the Lord shall be saved."
-                },
-                {
-                    "book": "Romans",
-                    "chapter": 10,
-                    "verse": 13,
-                    "text": "For whosoever shall call upon the name of the Lord shall be saved."
-                }
-            ]
-            json.dump(verses, input_file)
-            input_path = Path(input_file.name)
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as output_file:
-            output_path = Path(output_file.name)
-        
-        try:
-            checklist = generator.generate_checklist(input_path, output_path)
-            
-            # Should have only one item for Romans 10:13
-            romans_items = [item for item in checklist if item['ref'] == "Romans 10:13"]
-            assert len(romans_items) == 1
-            
-        finally:
-            input_path.unlink()
-            output_path.unlink()
+        input_path = tmp_path / "verses.json"
+        output_path = tmp_path / "checklist.json"
+        verses = [
+            {
+                "book": "Romans",
+                "chapter": 10,
+                "verse": 13,
+                "text": "For whosoever shall call upon the name of the Lord shall be saved."
+            },
+            {
+                "book": "Romans",
+                "chapter": 10,
+                "verse": 13,
+                "text": "For whosoever shall call upon the name of the Lord shall be saved."
+            }
+        ]
+        input_path.write_text(json.dumps(verses), encoding='utf-8')
+        
+        checklist = generator.generate_checklist(input_path, output_path)
+        
+        # Should have only one item for Romans 10:13
+        romans_count = sum(1 for item in checklist if item['ref'] == "Romans 10:13")
+        assert romans_count == 1
+    
+    def test_checklist_canonical_order(self, tmp_path, checklist_gen):
+        """Test that checklist is sorted by book order, chapter, then verse."""
+        generator = checklist_gen
+        
+        input_path = tmp_path / "verses.json"
+        output_path = tmp_path / "checklist.json"
+        verses = [
+            {"book": "Romans", "chapter": 10, "verse": 13, "text": "the name of the Lord"},
+            {"book": "Psalms", "chapter": 68, "verse": 4, "text": "Sing unto JAH"},
+            {"book": "Matthew", "chapter": 7, "verse": 21, "text": "Lord, Lord"},
+            {"book": "Romans", "chapter": 2, "verse": 1, "text": "O Lord"},
+        ]
+        input_path.write_text(json.dumps(verses), encoding='utf-8')
+        
+        checklist = generator.generate_checklist(input_path, output_path)
+        
+        refs = [item['ref'] for item in checklist]
+        assert refs == ["Psalms 68:4", "Matthew 7:21", "Romans 2:1", "Romans 10:13"]
     
-    def test_checklist_no_verse_text_in_output(self):
+    def test_checklist_unknown_books_not_interleaved(self, tmp_path, checklist_gen):
+        """Test that books outside the canon sort after it, each kept together."""
+        generator = checklist_gen
+        
+        input_path = tmp_path / "verses.json"
+        output_path = tmp_path / "checklist.json"
+        verses = [
+            {"book": "Tobit", "chapter": 2, "verse": 1, "text": "O Lord"},
+            {"book": "Enoch", "chapter": 1, "verse": 9, "text": "the Lord cometh"},
+            {"book": "Tobit", "chapter": 1, "verse": 1, "text": "the Lord"},
+            {"book": "Romans", "chapter": 10, "verse": 13, "text": "the name of the Lord"},
+        ]
+        input_path.write_text(json.dumps(verses), encoding='utf-8')
+        
+        checklist = generator.generate_checklist(input_path, output_path)
+        
+        refs = [item['ref'] for item in checklist]
+        assert refs == ["Romans 10:13", "Enoch 1:9", "Tobit 1:1", "Tobit 2:1"]
+    
+    def test_generate_checklist_from_jsonl(self, tmp_path, checklist_gen):
+        """Test that JSON Lines input gives the same checklist as a JSON list."""
+        generator = checklist_gen
+        verses = [
+            {"book": "Romans", "chapter": 10, "verse": 13, "text": "the name of the Lord"},
+            {"book": "Psalms", "chapter": 68, "verse": 4, "text": "Sing unto JAH"},
+        ]
+        
+        jsonl_path = tmp_path / "verses.jsonl"
+        json_path = tmp_path / "verses.json"
+        output_path = tmp_path / "checklist.json"
+        jsonl_path.write_text(''.join(json.dumps(verse) + '\n' for verse in verses) + '\n', encoding='utf-8')
+        json_path.write_text(json.dumps(verses), encoding='utf-8')
+        
+        from_jsonl = generator.generate_checklist(jsonl_path, output_path)
+        from_json = generator.generate_checklist(json_path, output_path)
+        
+        assert len(from_jsonl) == 2
+        assert from_jsonl == from_json
+    
+    def test_checklist_no_verse_text_in_output(self, tmp_path, checklist_gen):
         """Test that checklist does not include verse text from external Bibles."""
-        generator = ChecklistGenerator()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as input_file:
-            verses = [
-                {
-                    "book": "Romans",
-                    "chapter": 10,
-                    "verse": 13,
-                    "text": "For whosoever shall call upon the name of the Lord shall be saved."
-                }
-            ]
-            json.dump(verses, input_file)
-            input_path = Path(input_file.name)
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as output_file:
-            output_path = Path(output_file.name)
-        
-        try:
-            checklist = generator.generate_checklist(input_path, output_path)
-            
-            # Verify checklist items don't contain full verse text
-            for item in checklist:
-                # Should only have ref, needs, suggested, witnesses_required
-                assert 'text' not in item
-                assert 'verse_text' not in item
-                assert 'cepher_text' not in item
-                assert 'dabar_yahuah_text' not in item
-                
-        finally:
-            input_path.unlink()
-            output_path.unlink()
-
+        generator = checklist_gen
+        
+        input_path = tmp_path / "verses.json"
+        output_path = tmp_path / "checklist.json"
+        verses = [
+            {
+                "book": "Romans",
+                "chapter": 10,
+                "verse": 13,
+                "text": "For whosoever shall call upon the name of the Lord shall be saved."
+            }
+        ]
+        input_path.write_text(json.dumps(verses), encoding='utf-8')
+        
+        checklist = generator.generate_checklist(input_path, output_path)
+        
+        # Verify checklist items don't contain full verse text
+        for item in checklist:
+            # Should only have ref, needs, suggested, witnesses_required
+            assert 'text' not in item
+            assert 'verse_text' not in item
+            assert 'cepher_text' not in item
+            assert 'dabar_yahuah_text' not in item
@@ -2,8 +2,6 @@
 
 import pytest
 from pathlib import Path
-import tempfile
-import json
 
 from kjv_restored.converter import RestoredNamesConverter
 from kjv_restored.config import Config
@@ -13,133 +11,124 @@ from kjv_restored.witness import WitnessManager
 class TestRestoredNamesConverter:
     """Test cases for RestoredNamesConverter."""
     
-    def test_basic_conversion(self):
+    def test_basic_conversion(self, default_converter):
         """Test basic text conversion."""
-        converter = RestoredNamesConverter()
+        converter = default_converter
         text = "For God so loved the world."
         result = converter.convert_text(text)
         assert "YAHUAH" in result
         assert "God" not in result
     
-    def test_parse_verse_reference(self):
+    @pytest.mark.parametrize("text,expected", [
+        ("John 3:16 For God so loved...", ("John", 3, 16)),
+        ("1 John 3:16 Some text", ("1 John", 3, 16)),
+        ("1st John 3:16 Some text", ("1st John", 3, 16)),
+        ("Genesis 1:1 In the beginning", ("Genesis", 1, 1)),
+        ("Song of Solomon 1:1 The song of songs", ("Song of Solomon", 1, 1)),
+        ("see Genesis 1:1", ("Genesis", 1, 1)),
+        ("Enoch 1:9 Behold", ("Enoch", 1, 9)),
+        ("1ST JOHN 1:1 That which was", ("1ST JOHN", 1, 1)),
+        ("Just some text", None),
+    ], ids=["simple", "numbered_book", "ordinal_book", "genesis", "multi_word_book",
+            "leading_text", "unknown_book", "unknown_variant_case", "no_reference"])
+    def test_parse_verse_reference(self, default_converter, text, expected):
         """Test verse reference parsing."""
-        converter = RestoredNamesConverter()
-        
-        # Test simple reference
-        ref = converter.parse_verse_reference("John 3:16 For God so loved...")
-        assert ref == ("John", 3, 16)
-        
-        # Test numbered book
-        ref = converter.parse_verse_reference("1 John 3:16 Some text")
-        assert ref == ("1 John", 3, 16)
-        
-        # Test Genesis
-        ref = converter.parse_verse_reference("Genesis 1:1 In the beginning")
-        assert ref == ("Genesis", 1, 1)
-        
-        # Test no reference
-        ref = converter.parse_verse_reference("Just some text")
-        assert ref is None
+        assert default_converter.parse_verse_reference(text) == expected
     
-    def test_get_verse_key(self):
+    def test_get_verse_key(self, default_converter):
         """Test verse key generation."""
-        converter = RestoredNamesConverter()
+        converter = default_converter
         key = converter.get_verse_key("John", 3, 16)
         assert key == "John 3:16"
     
-    def test_convert_verse(self):
+    def test_apply_replacements(self, default_converter):
+        """Test that fused and chained override replacements match in-order application."""
+        converter = default_converter
+        
+        # Independent replacements (single pass)
+        text = "the LORD said unto my Lord, Sit"
+        result = converter._apply_replacements(text, {"LORD": "YAHUAH", "Lord": "ADON"})
+        assert result == "the YAHUAH said unto my ADON, Sit"
+        
+        # Chained replacements are still applied one after another
+        result = converter._apply_replacements("the Lord", {"Lord": "Master", "Master": "ADON"})
+        assert result == "the ADON"
+        
+        # Whole words only
+        result = converter._apply_replacements("Lordship of the Lord", {"Lord": "ADON"})
+        assert result == "Lordship of the ADON"
+    
+    def test_convert_verse(self, default_converter):
         """Test verse-specific conversion."""
-        converter = RestoredNamesConverter()
+        converter = default_converter
         text = "For God so loved the world."
         result = converter.convert_verse(text, "John", 3, 16)
         assert "YAHUAH" in result
     
     def test_convert_with_override(self):
         """Test conversion with verse override."""
-        # Create temporary overrides file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            overrides = {
-                "John 3:16": {
-                    "replacement": "For YAHUAH so loved the world (OVERRIDE).",
-                    "witnesses": ["cepher"],
-                    "require_witness": False
-                }
+        overrides = {
+            "John 3:16": {
+                "replacement": "For YAHUAH so loved the world (OVERRIDE).",
+                "witnesses": ["cepher"],
+                "require_witness": False
             }
-            json.dump(overrides, f)
-            overrides_path = Path(f.name)
-        
-        try:
-            config = Config(overrides_file=overrides_path, verse_aware=True)
-            converter = RestoredNamesConverter(config=config)
-            
-            text = "For God so loved the world."
-            result = converter.convert_verse(text, "John", 3, 16)
-            
-            # Should use override
-            assert "OVERRIDE" in result
-        finally:
-            overrides_path.unlink()
+        }
+        config = Config(overrides=overrides, verse_aware=True)
+        converter = RestoredNamesConverter(config=config)
+        
+        text = "For God so loved the world."
+        result = converter.convert_verse(text, "John", 3, 16)
+        
+        # Should use override
+        assert "OVERRIDE" in result
     
     def test_convert_without_override(self):
         """Test conversion without override uses default rules."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            overrides = {}
-            json.dump(overrides, f)
-            overrides_path = Path(f.name)
-        
-        try:
-            config = Config(overrides_file=overrides_path, verse_aware=True)
-            converter = RestoredNamesConverter(config=config)
-            
-            text = "For God so loved the world."
-            result = converter.convert_verse(text, "John", 3, 16)
-            
-            # Should use default rules
-            assert "YAHUAH" in result
-            assert "God" not in result
-        finally:
-            overrides_path.unlink()
+        config = Config(overrides={}, verse_aware=True)
+        converter = RestoredNamesConverter(config=config)
+        
+        text = "For God so loved the world."
+        result = converter.convert_verse(text, "John", 3, 16)
+        
+        # Should use default rules
+        assert "YAHUAH" in result
+        assert "God" not in result
     
     def test_enforce_witnesses(self):
         """Test witness enforcement."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            overrides = {
-                "John 3:16": {
-                    "replacement": "OVERRIDE WITH WITNESS",
-                    "witnesses": ["cepher"],
-                    "require_witness": False
-                },
-                "John 1:1": {
-                    "replacement": "OVERRIDE WITHOUT WITNESS",
-                    "witnesses": [],
-                    "require_witness": False
-                }
+        overrides = {
+            "John 3:16": {
+                "replacement": "OVERRIDE WITH WITNESS",
+                "witnesses": ["cepher"],
+                "require_witness": False
+            },
+            "John 1:1": {
+                "replacement": "OVERRIDE WITHOUT WITNESS",
+                "witnesses": [],
+                "require_witness": False
             }
-            json.dump(overrides, f)
-            overrides_path = Path(f.name)
-        
-        try:
-            # Test with enforce_witnesses=True
-            config = Config(
-                overrides_file=overrides_path,
-                verse_aware=True,
-                enforce_witnesses=True
-            )
-            converter = RestoredNamesConverter(config=config)
-            
-            # Should apply override with witness
-            result1 = converter.convert_verse("test", "John", 3, 16)
-            assert "OVERRIDE WITH WITNESS" in result1
-            
-            # Should NOT apply override without witness
-            result2 = converter.convert_verse("test", "John", 1, 1)
-            assert "OVERRIDE WITHOUT WITNESS" not in result2
-        finally:
-            overrides_path.unlink()
+        }
+        
+        # Test with enforce_witnesses=True
+        config = Config(
+            overrides=overrides,
+            verse_aware=True,
+            enforce_witnesses=True
+        )
+        converter = RestoredNamesConverter(config=config)
+        
+        # Should apply override with witness
+        result1 = converter.convert_verse("test", "John", 3, 16)
+        assert "OVERRIDE WITH WITNESS" in result1
+        
+        # Should NOT apply override without witness
+        result2 = converter.convert_verse("test", "John", 1, 1)
+        assert "OVERRIDE WITHOUT WITNESS" not in result2
     
-    def test_batch_convert(self):
+    def test_batch_convert(self, default_converter):
         """Test batch conversion of multiple verses."""
-        converter = RestoredNamesConverter()
+        converter = default_converter
         
         verses = [
             {
@@ -165,29 +154,54 @@ class TestRestoredNamesConverter:
         assert "YAHUAH" in results[0]['converted']
         assert "YAHUSHA HA'MASHIACH" in results[1]['converted']
     
+    def test_batch_convert_parallel_matches_serial(self):
+        """Test that converting chunks in worker processes matches a serial batch."""
+        verses = [
+            {'text': 'For God so loved the world.', 'book': 'John', 'chapter': 3, 'verse': 16},
+            {'text': 'call upon the name of the Lord', 'book': 'Romans', 'chapter': 10, 'verse': 13},
+            {'text': 'extol him by his name JAH', 'book': 'Psalms', 'chapter': 68, 'verse': 4},
+            {'text': 'Jesus Christ is Lord.', 'book': 'John', 'chapter': 1, 'verse': 1},
+            {'text': 'Praise ye the LORD.', 'book': 'Psalms', 'chapter': 150, 'verse': 6},
+        ]
+        config = Config(overrides_file=Path("nonexistent_overrides.json"), hallelujah_heuristic=True)
+        
+        serial = RestoredNamesConverter(config=config)
+        parallel = RestoredNamesConverter(config=config)
+        
+        assert parallel.batch_convert(verses, max_workers=2) == serial.batch_convert(verses)
+        assert parallel.get_ambiguous_lords() == serial.get_ambiguous_lords()
+        assert parallel.get_heuristic_replacements() == serial.get_heuristic_replacements()
+    
+    def test_iter_convert_matches_batch(self):
+        """Test that streaming conversion yields the same results as a batch."""
+        verses = [
+            {'text': 'For God so loved the world.', 'book': 'John', 'chapter': 3, 'verse': 16},
+            {'text': 'call upon the name of the Lord', 'book': 'Romans', 'chapter': 10, 'verse': 13},
+        ]
+        config = Config(overrides_file=Path("nonexistent_overrides.json"))
+        
+        batch = RestoredNamesConverter(config=config)
+        streaming = RestoredNamesConverter(config=config)
+        
+        assert list(streaming.iter_convert(iter(verses))) == batch.batch_convert(verses)
+        assert streaming.get_ambiguous_lords() == batch.get_ambiguous_lords()
+    
     def test_verse_aware_disabled(self):
         """Test that verse-aware mode can be disabled."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            overrides = {
-                "John 3:16": {
-                    "replacement": "OVERRIDE TEXT",
-                    "witnesses": ["cepher"],
-                    "require_witness": False
-                }
+        overrides = {
+            "John 3:16": {
+                "replacement": "OVERRIDE TEXT",
+                "witnesses": ["cepher"],
+                "require_witness": False
             }
-            json.dump(overrides, f)
-            overrides_path = Path(f.name)
-        
-        try:
-            config = Config(overrides_file=overrides_path, verse_aware=False)
-            converter = RestoredNamesConverter(config=config)
-            
-            # Should not use override when verse_aware is False
-            text = "For God so loved the world."
-            result = converter.convert_verse(text, "John", 3, 16)
-            
-            assert "OVERRIDE TEXT" not in result
-            assert "YAHUAH" in result  # Should use default rules
-        finally:
-            overrides_path.unlink()
+        }
+        config = Config(overrides=overrides, verse_aware=False)
+        converter = RestoredNamesConverter(config=config)
+        
+        # Should not use override when verse_aware is False
+        text = "For God so loved the world."
+        result = converter.convert_verse(text, "John", 3, 16)
+        
+        assert "OVERRIDE TEXT" not in result
+        assert "YAHUAH" in result  # Should use default rules
 
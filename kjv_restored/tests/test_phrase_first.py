@@ -1,9 +1,6 @@
 """Tests for phrase-first replacements and whole-word boundaries."""
 
 import pytest
-import tempfile
-import json
-from pathlib import Path
 
 from kjv_restored.rules import NameRules
 from kjv_restored.converter import RestoredNamesConverter
@@ -165,33 +162,26 @@ class TestLordAmbiguous:
     
     def test_lord_with_override_strict(self):
         """Test that 'Lord' can be overridden in strict mode."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            overrides = {
-                "Psalms 23:1": {
-                    "replacement": "The ADON is my shepherd.",
-                    "witnesses": ["cepher"],
-                    "require_witness": False
-                }
+        overrides = {
+            "Psalms 23:1": {
+                "replacement": "The ADON is my shepherd.",
+                "witnesses": ["cepher"],
+                "require_witness": False
             }
-            json.dump(overrides, f)
-            overrides_path = Path(f.name)
+        }
+        config = Config(
+            overrides=overrides,
+            verse_aware=True,
+            strict_mode=True
+        )
+        converter = RestoredNamesConverter(config=config)
+        
+        text = "The Lord is my shepherd."
+        result = converter.convert_verse(text, "Psalms", 23, 1)
         
-        try:
-            config = Config(
-                overrides_file=overrides_path,
-                verse_aware=True,
-                strict_mode=True
-            )
-            converter = RestoredNamesConverter(config=config)
-            
-            text = "The Lord is my shepherd."
-            result = converter.convert_verse(text, "Psalms", 23, 1)
-            
-            # Should use override
-            assert "ADON" in result
-            assert "Lord" not in result
-        finally:
-            overrides_path.unlink()
+        # Should use override
+        assert "ADON" in result
+        assert "Lord" not in result
     
     def test_lord_vs_lord_case_sensitivity(self):
         """Test that 'LORD' (all caps) and 'Lord' (title case) are handled differently."""
@@ -250,10 +240,9 @@ class TestPhraseOrderingEdgeCases:
 class TestIntegration:
     """Integration tests for phrase-first replacements."""
     
-    def test_full_conversion_with_phrases(self):
+    def test_full_conversion_with_phrases(self, default_converter):
         """Test full conversion with phrase-first logic."""
-        config = Config(strict_mode=False)
-        converter = RestoredNamesConverter(config=config)
+        converter = default_converter
         
         text = "Jesus Christ is the Lord. The Holy Spirit guides us."
         result = converter.convert_text(text)
@@ -266,10 +255,9 @@ class TestIntegration:
         assert "Lord" not in result
         assert "Holy Spirit" not in result
     
-    def test_strict_mode_preserves_lord(self):
+    def test_strict_mode_preserves_lord(self, strict_converter):
         """Test that strict mode preserves 'Lord' without override."""
-        config = Config(strict_mode=True)
-        converter = RestoredNamesConverter(config=config)
+        converter = strict_converter
         
         text = "The Lord is my shepherd."
         result = converter.convert_text(text)
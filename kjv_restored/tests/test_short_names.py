@@ -1,9 +1,6 @@
 """Tests for short name support."""
 
 import pytest
-import tempfile
-import json
-from pathlib import Path
 
 from kjv_restored.rules import NameRules
 from kjv_restored.converter import RestoredNamesConverter
@@ -14,48 +11,19 @@ from kjv_restored.witness import WitnessManager
 class TestJAHConversion:
     """Test JAH -> YAH conversion."""
     
-    def test_jah_to_yah_uppercase(self):
-        """Test JAH -> YAH conversion (uppercase)."""
-        text = "Sing unto JAH, sing praises to JAH."
-        result, changed = NameRules.convert_jah_to_yah(text)
-        assert changed is True
-        assert "YAH" in result
-        assert "JAH" not in result
-        assert result == "Sing unto YAH, sing praises to YAH."
-    
-    def test_jah_to_yah_lowercase(self):
-        """Test jah -> yah conversion (lowercase)."""
-        text = "Sing unto jah, sing praises to jah."
-        result, changed = NameRules.convert_jah_to_yah(text)
-        assert changed is True
-        assert "yah" in result
-        assert "jah" not in result
-        assert result == "Sing unto yah, sing praises to yah."
-    
-    def test_jah_to_yah_title_case(self):
-        """Test Jah -> Yah conversion (title case)."""
-        text = "Sing unto Jah, sing praises to Jah."
-        result, changed = NameRules.convert_jah_to_yah(text)
-        assert changed is True
-        assert "Yah" in result
-        assert "Jah" not in result
-        assert result == "Sing unto Yah, sing praises to Yah."
-    
-    def test_jah_preserves_punctuation(self):
-        """Test that JAH conversion preserves punctuation."""
-        text = "JAH! JAH? JAH, JAH."
-        result, changed = NameRules.convert_jah_to_yah(text)
-        assert changed is True
-        assert result == "YAH! YAH? YAH, YAH."
-    
-    def test_jah_not_in_other_words(self):
-        """Test that JAH is not converted when part of other words."""
-        text = "Hallelujah is a word. JAH is separate."
+    @pytest.mark.parametrize("text,expected", [
+        ("Sing unto JAH, sing praises to JAH.", "Sing unto YAH, sing praises to YAH."),
+        ("Sing unto jah, sing praises to jah.", "Sing unto yah, sing praises to yah."),
+        ("Sing unto Jah, sing praises to Jah.", "Sing unto Yah, sing praises to Yah."),
+        ("JAH! JAH? JAH, JAH.", "YAH! YAH? YAH, YAH."),
+        # JAH inside another word (Hallelujah) is left unchanged
+        ("Hallelujah is a word. JAH is separate.", "Hallelujah is a word. YAH is separate."),
+    ], ids=["uppercase", "lowercase", "title_case", "preserves_punctuation", "not_in_other_words"])
+    def test_jah_to_yah(self, text, expected):
+        """Test JAH -> YAH conversion keeps casing, punctuation and other words."""
         result, changed = NameRules.convert_jah_to_yah(text)
         assert changed is True
-        assert "Hallelujah" in result  # Should remain unchanged
-        assert "YAH" in result  # JAH should be converted
-        assert "JAH" not in result
+        assert result == expected
     
     def test_no_jah_no_change(self):
         """Test that text without JAH is unchanged."""
@@ -74,7 +42,6 @@ class TestHallelujahHeuristic:
         result, changed = NameRules.apply_hallelujah_heuristic(text)
         assert changed is True
         assert result == "Hallelu-YAH."
-        assert "Praise ye the LORD" not in result
     
     def test_hallelujah_heuristic_without_period(self):
         """Test Hallelujah heuristic: 'Praise ye the LORD' -> 'Hallelu-YAH'"""
@@ -88,8 +55,7 @@ class TestHallelujahHeuristic:
         text = "The people said, Praise ye the LORD. And they rejoiced."
         result, changed = NameRules.apply_hallelujah_heuristic(text)
         assert changed is True
-        assert "Hallelu-YAH." in result
-        assert "Praise ye the LORD" not in result
+        assert result == "The people said, Hallelu-YAH. And they rejoiced."
     
     def test_hallelujah_heuristic_no_match(self):
         """Test that non-matching text is unchanged."""
@@ -98,15 +64,13 @@ class TestHallelujahHeuristic:
         assert changed is False
         assert result == text
     
-    def test_hallelujah_heuristic_disabled(self):
+    def test_hallelujah_heuristic_disabled(self, converter_factory):
         """Test that heuristic is not applied when disabled."""
-        config = Config(hallelujah_heuristic=False)
-        converter = RestoredNamesConverter(config=config)
+        converter = converter_factory(hallelujah_heuristic=False)
         text = "Praise ye the LORD."
         result = converter.convert_text(text)
         # Should convert LORD to YAHUAH but not apply heuristic
-        assert "YAHUAH" in result
-        assert "Hallelu-YAH" not in result
+        assert result == "Praise ye the YAHUAH."
 
 
 class TestWitnessedMode:
@@ -114,111 +78,87 @@ class TestWitnessedMode:
     
     def test_witnessed_mode_rejects_yah_without_both_witnesses(self):
         """Test that witnessed mode rejects YAH-short override without both witnesses."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            overrides = {
-                "Psalms 68:4": {
-                    "replacement": "Sing unto YAH, sing praises to YAH. [OVERRIDE]",
-                    "witnesses": ["cepher"],  # Only one witness
-                    "require_witness": False
-                }
+        overrides = {
+            "Psalms 68:4": {
+                "replacement": "Sing unto YAH, sing praises to YAH. [OVERRIDE]",
+                "witnesses": ["cepher"],  # Only one witness
+                "require_witness": False
             }
-            json.dump(overrides, f)
-            overrides_path = Path(f.name)
+        }
+        config = Config(
+            overrides=overrides,
+            verse_aware=True,
+            short_name_mode="witnessed"
+        )
+        converter = RestoredNamesConverter(config=config)
+        
+        # Should NOT use override because it has YAH short form but only one witness
+        text = "Sing unto JAH, sing praises to JAH."
+        result = converter.convert_verse(text, "Psalms", 68, 4)
         
-        try:
-            config = Config(
-                overrides_file=overrides_path,
-                verse_aware=True,
-                short_name_mode="witnessed"
-            )
-            converter = RestoredNamesConverter(config=config)
-            
-            # Should NOT use override because it has YAH short form but only one witness
-            text = "Sing unto JAH, sing praises to JAH."
-            result = converter.convert_verse(text, "Psalms", 68, 4)
-            
-            # Should use default rules (JAH -> YAH), not the override
-            assert "YAH" in result
-            assert "[OVERRIDE]" not in result  # Override was rejected
-        finally:
-            overrides_path.unlink()
+        # Should use default rules (JAH -> YAH), not the override
+        assert result == "Sing unto YAH, sing praises to YAH."
     
     def test_witnessed_mode_accepts_yah_with_both_witnesses(self):
         """Test that witnessed mode accepts YAH-short override with both witnesses."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            overrides = {
-                "Psalms 68:4": {
-                    "replacement": "Sing unto YAH, sing praises to YAH.",
-                    "witnesses": ["cepher", "dabar_yahuah"],  # Both witnesses
-                    "require_witness": False
-                }
+        overrides = {
+            "Psalms 68:4": {
+                "replacement": "Sing unto YAH, sing praises to YAH.",
+                "witnesses": ["cepher", "dabar_yahuah"],  # Both witnesses
+                "require_witness": False
             }
-            json.dump(overrides, f)
-            overrides_path = Path(f.name)
+        }
+        config = Config(
+            overrides=overrides,
+            verse_aware=True,
+            short_name_mode="witnessed"
+        )
+        converter = RestoredNamesConverter(config=config)
         
-        try:
-            config = Config(
-                overrides_file=overrides_path,
-                verse_aware=True,
-                short_name_mode="witnessed"
-            )
-            converter = RestoredNamesConverter(config=config)
-            
-            # Should use override because it has both witnesses
-            text = "Sing unto JAH, sing praises to JAH."
-            result = converter.convert_verse(text, "Psalms", 68, 4)
-            
-            # Should use the override
-            assert result == "Sing unto YAH, sing praises to YAH."
-        finally:
-            overrides_path.unlink()
+        # Should use override because it has both witnesses
+        text = "Sing unto JAH, sing praises to JAH."
+        result = converter.convert_verse(text, "Psalms", 68, 4)
+        
+        # Should use the override
+        assert result == "Sing unto YAH, sing praises to YAH."
     
     def test_witnessed_mode_accepts_yahuah_override(self):
         """Test that witnessed mode accepts YAHUAH (not short form) override with one witness."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            overrides = {
-                "Psalms 68:4": {
-                    "replacement": "Sing unto YAHUAH, sing praises to YAHUAH.",
-                    "witnesses": ["cepher"],  # Only one witness, but YAHUAH not YAH
-                    "require_witness": False
-                }
+        overrides = {
+            "Psalms 68:4": {
+                "replacement": "Sing unto YAHUAH, sing praises to YAHUAH.",
+                "witnesses": ["cepher"],  # Only one witness, but YAHUAH not YAH
+                "require_witness": False
             }
-            json.dump(overrides, f)
-            overrides_path = Path(f.name)
+        }
+        config = Config(
+            overrides=overrides,
+            verse_aware=True,
+            short_name_mode="witnessed"
+        )
+        converter = RestoredNamesConverter(config=config)
+        
+        # Should use override because it's YAHUAH, not YAH short form
+        text = "Sing unto JAH, sing praises to JAH."
+        result = converter.convert_verse(text, "Psalms", 68, 4)
         
-        try:
-            config = Config(
-                overrides_file=overrides_path,
-                verse_aware=True,
-                short_name_mode="witnessed"
-            )
-            converter = RestoredNamesConverter(config=config)
-            
-            # Should use override because it's YAHUAH, not YAH short form
-            text = "Sing unto JAH, sing praises to JAH."
-            result = converter.convert_verse(text, "Psalms", 68, 4)
-            
-            # Should use the override (YAHUAH, not YAH)
-            assert result == "Sing unto YAHUAH, sing praises to YAHUAH."
-        finally:
-            overrides_path.unlink()
+        # Should use the override (YAHUAH, not YAH)
+        assert result == "Sing unto YAHUAH, sing praises to YAHUAH."
     
-    def test_kjv_only_mode_allows_jah_conversion(self):
+    def test_kjv_only_mode_allows_jah_conversion(self, default_converter):
         """Test that kjv_only mode allows JAH -> YAH conversion."""
-        config = Config(short_name_mode="kjv_only")
-        converter = RestoredNamesConverter(config=config)
+        converter = default_converter
+        assert converter.config.short_name_mode == "kjv_only"
         
         text = "Sing unto JAH, sing praises to JAH."
         result = converter.convert_text(text)
         
         # Should convert JAH to YAH
-        assert "YAH" in result
-        assert "JAH" not in result
+        assert result == "Sing unto YAH, sing praises to YAH."
     
-    def test_off_mode_disables_jah_conversion(self):
+    def test_off_mode_disables_jah_conversion(self, converter_factory):
         """Test that off mode disables JAH -> YAH conversion."""
-        config = Config(short_name_mode="off")
-        converter = RestoredNamesConverter(config=config)
+        converter = converter_factory(short_name_mode="off")
         
         text = "Sing unto JAH, sing praises to JAH."
         result = converter.convert_text(text)
@@ -232,57 +172,46 @@ class TestWitnessedMode:
 class TestShortNameIntegration:
     """Integration tests for short name features."""
     
-    def test_jah_conversion_with_other_conversions(self):
+    def test_jah_conversion_with_other_conversions(self, default_converter):
         """Test JAH conversion works with other name conversions."""
-        config = Config(short_name_mode="kjv_only")
-        converter = RestoredNamesConverter(config=config)
+        converter = default_converter
         
         text = "Sing unto JAH, sing praises to JAH. For God so loved the world."
         result = converter.convert_text(text)
         
-        assert "YAH" in result  # From JAH conversion
-        assert "YAHUAH" in result  # From God conversion
-        assert "JAH" not in result
-        assert "God" not in result
+        # JAH -> YAH and God -> YAHUAH
+        assert result == "Sing unto YAH, sing praises to YAH. For YAHUAH so loved the world."
     
-    def test_hallelujah_heuristic_integration(self):
+    def test_hallelujah_heuristic_integration(self, converter_factory):
         """Test Hallelujah heuristic integration."""
-        config = Config(hallelujah_heuristic=True)
-        converter = RestoredNamesConverter(config=config)
+        converter = converter_factory(hallelujah_heuristic=True)
         
         text = "Praise ye the LORD."
         result = converter.convert_text(text)
         
         # Should apply heuristic
-        assert "Hallelu-YAH" in result or "Hallelu-YAH." in result
+        assert result == "Hallelu-YAH."
     
     def test_witnessed_mode_with_enforce_witnesses(self):
         """Test witnessed mode combined with enforce_witnesses."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            overrides = {
-                "Psalms 68:4": {
-                    "replacement": "Sing unto YAH, sing praises to YAH.",
-                    "witnesses": ["cepher", "dabar_yahuah"],
-                    "require_witness": False
-                }
+        overrides = {
+            "Psalms 68:4": {
+                "replacement": "Sing unto YAH, sing praises to YAH.",
+                "witnesses": ["cepher", "dabar_yahuah"],
+                "require_witness": False
             }
-            json.dump(overrides, f)
-            overrides_path = Path(f.name)
+        }
+        config = Config(
+            overrides=overrides,
+            verse_aware=True,
+            short_name_mode="witnessed",
+            enforce_witnesses=True
+        )
+        converter = RestoredNamesConverter(config=config)
+        
+        # Should use override because it has both witnesses
+        text = "Sing unto JAH, sing praises to JAH."
+        result = converter.convert_verse(text, "Psalms", 68, 4)
         
-        try:
-            config = Config(
-                overrides_file=overrides_path,
-                verse_aware=True,
-                short_name_mode="witnessed",
-                enforce_witnesses=True
-            )
-            converter = RestoredNamesConverter(config=config)
-            
-            # Should use override because it has both witnesses
-            text = "Sing unto JAH, sing praises to JAH."
-            result = converter.convert_verse(text, "Psalms", 68, 4)
-            
-            assert result == "Sing unto YAH, sing praises to YAH."
-        finally:
-            overrides_path.unlink()
+        assert result == "Sing unto YAH, sing praises to YAH."
 